@@ -9,6 +9,9 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 
 from config.settings import Settings
+from utils.finance_metrics import FinanceMetricsTools
+from utils.market_snapshot import MarketSnapshotTools
+from utils.stock_screener import StockScreenerTools
 
 
 #Verify the env variables
@@ -26,7 +29,10 @@ finance_agent = Agent(
             historical_prices=True,
             company_info=True,
             company_news=True,
-        )
+        ),
+        MarketSnapshotTools(),
+        FinanceMetricsTools(),
+        StockScreenerTools(),
     ],
     instructions=dedent("""\
         You are a veteran financial analyst specializing in equity markets 📈💼
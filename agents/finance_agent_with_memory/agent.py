@@ -26,6 +26,8 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 
 from config.settings import Settings
+from utils.finance_metrics import FinanceMetricsTools
+from utils.market_snapshot import MarketSnapshotTools
 
 
 #Verify the env variables
@@ -43,7 +45,9 @@ finance_agent = Agent(
             historical_prices=True,
             company_info=True,
             company_news=True,
-        )
+        ),
+        MarketSnapshotTools(),
+        FinanceMetricsTools(),
     ],
     instructions=dedent("""\
         You are a seasoned Wall Street analyst with deep expertise in market analysis! 📊
@@ -27,6 +27,8 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 
 from config.settings import Settings
+from utils.finance_metrics import FinanceMetricsTools
+from utils.market_snapshot import MarketSnapshotTools
 
 
 # Verify the env variables
@@ -35,7 +37,7 @@ settings.validate()
 
 finance_agent = Agent(
     model=OpenAIChat(id="gpt-4o-mini", api_key=settings.openai_api_key),
-    tools=[ReasoningTools(add_instructions=True), YFinanceTools(enable_all=True)],
+    tools=[ReasoningTools(add_instructions=True), YFinanceTools(enable_all=True), MarketSnapshotTools(), FinanceMetricsTools()],
     instructions=dedent("""\
         You are a financial summary agent. For any stock or company:
         - Provide a concise executive summary.
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the CLI and server entry points.
+
+Each mode runs in a fresh interpreter so module caches don't hide import cost.
+Agent modules are imported in registry load mode, so no LLM calls are made,
+but the required API keys must still be set for the modules to import.
+
+Usage:
+    python benchmarks/startup.py --agent finance_agent --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "cli-import": "import main",
+    "cli-list": "import main; main.AgentOrchestrator()",
+    "cli-direct": (
+        "import main; o = main.AgentOrchestrator(discover=False); "
+        "o.register_agent({agent!r}); o.get_agent_instance({agent!r})"
+    ),
+    "server": "import server; server.create_app()",
+}
+
+
+def time_mode(code: str) -> float:
+    """Return the wall-clock seconds a fresh interpreter takes to run ``code``"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agent", default="finance_agent", help="Agent ID used for the direct mode")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode")
+    parser.add_argument("--modes", nargs="*", default=list(MODES), choices=list(MODES))
+    args = parser.parse_args()
+
+    print(f"{'mode':<12} {'min (s)':>9} {'median (s)':>11}")
+    for mode in args.modes:
+        code = MODES[mode].format(agent=args.agent)
+        try:
+            samples = [time_mode(code) for _ in range(args.repeat)]
+        except subprocess.CalledProcessError as e:
+            print(f"{mode:<12} failed (exit code {e.returncode})")
+            continue
+        print(f"{mode:<12} {min(samples):>9.3f} {statistics.median(samples):>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Agno Unified Agent Project - Daemon Client
+Thin client that forwards queries to a running orchestrator daemon
+
+Start the daemon once:
+    python main.py --daemon
+Then query it with near-zero startup cost:
+    python client.py --agent finance_agent --query "Summarize MSFT"
+
+Only the standard library is imported so the client starts instantly.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET_PATH = os.getenv("ORCHESTRATOR_SOCKET", "tmp/orchestrator.sock")
+
+
+def request(socket_path: str, payload: dict):
+    """Send one request to the daemon and yield the JSON messages it streams back"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query a running orchestrator daemon")
+    parser.add_argument("--agent", "-a", help="Agent ID to run")
+    parser.add_argument("--query", "-q", help="Query to run with the agent")
+    parser.add_argument("--list", action="store_true", help="List the agents the daemon serves")
+    parser.add_argument("--stats", action="store_true", help="Show the daemon's agent registry counters")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Daemon socket path")
+    args = parser.parse_args()
+
+    if args.list:
+        payload = {"op": "list"}
+    elif args.stats:
+        payload = {"op": "stats"}
+    elif args.agent and args.query:
+        payload = {"op": "run", "agent": args.agent, "query": args.query}
+    else:
+        parser.error("either --list, --stats or both --agent and --query are required")
+
+    try:
+        for message in request(args.socket, payload):
+            if message["type"] == "chunk":
+                sys.stdout.write(message["content"])
+                sys.stdout.flush()
+            elif message["type"] == "agents":
+                for key, config in sorted(message["agents"].items()):
+                    print(f"{config['emoji']} {key}: {config['name']}")
+            elif message["type"] == "stats":
+                for name, value in message["stats"].items():
+                    print(f"{name}: {value}")
+            elif message["type"] == "done":
+                print()
+            elif message["type"] == "error":
+                print(f"Error: {message['message']}", file=sys.stderr)
+                sys.exit(1)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No daemon listening on {args.socket}. Start one with: python main.py --daemon", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
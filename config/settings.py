@@ -13,6 +13,47 @@ class Settings:
         self.fire_crawl_api_key = os.getenv("FIRE_CRAWL_API_KEY")
         self.cartesia_api_key = os.getenv("CARTESIA_API_KEY")
 
+        # Agent module loading
+        self.agent_load_workers = int(os.getenv("AGENT_LOAD_WORKERS", "8"))
+        self.agent_load_timeout = float(os.getenv("AGENT_LOAD_TIMEOUT", "30"))
+        self.agent_hot_reload = os.getenv("AGENT_HOT_RELOAD", "false").lower() in ("1", "true", "yes")
+
+        # Loaded agent instance budget (0 disables a limit)
+        self.agent_max_instances = int(os.getenv("AGENT_MAX_INSTANCES", "0"))
+        self.agent_idle_seconds = float(os.getenv("AGENT_IDLE_SECONDS", "0"))
+        self.agent_max_rss_mb = float(os.getenv("AGENT_MAX_RSS_MB", "0"))
+
+        # Agent execution
+        self.agent_max_concurrency = int(os.getenv("AGENT_MAX_CONCURRENCY", "8"))
+        self.agent_stream = os.getenv("AGENT_STREAM", "true").lower() in ("1", "true", "yes")
+        self.agent_single_flight = os.getenv("AGENT_SINGLE_FLIGHT", "true").lower() in ("1", "true", "yes")
+        self.agent_batch_concurrency = int(os.getenv("AGENT_BATCH_CONCURRENCY", "2"))
+
+        # Exact-match response cache (stateless agents only)
+        self.response_cache = os.getenv("RESPONSE_CACHE", "false").lower() in ("1", "true", "yes")
+        self.response_cache_ttl = float(os.getenv("RESPONSE_CACHE_TTL", "86400"))
+        self.response_cache_max_entries = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+        self.response_cache_bucket_seconds = float(os.getenv("RESPONSE_CACHE_BUCKET_SECONDS", "3600"))
+
+        # Semantic response cache, opt-in per agent name (comma separated)
+        self.semantic_cache_agents = [
+            name.strip() for name in os.getenv("SEMANTIC_CACHE_AGENTS", "").split(",") if name.strip()
+        ]
+        self.semantic_cache_threshold = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+        self.semantic_cache_ttl = float(os.getenv("SEMANTIC_CACHE_TTL", "86400"))
+
+        # Shared tool-call cache (YFinance, ...); an empty path keeps it in memory only
+        self.tool_cache = os.getenv("TOOL_CACHE", "true").lower() in ("1", "true", "yes")
+        self.tool_cache_path = os.getenv("TOOL_CACHE_PATH", "tmp/tool_cache.db")
+        # Local daily price history; an empty path always asks Yahoo
+        self.price_store_path = os.getenv("PRICE_STORE_PATH", "tmp/price_store")
+        # Local store of Firecrawl pages; an empty path always asks Firecrawl
+        self.page_store_path = os.getenv("PAGE_STORE_PATH", "tmp/page_store")
+        self.page_store_ttl = float(os.getenv("PAGE_STORE_TTL", "86400"))
+
+        # Resident daemon
+        self.orchestrator_socket = os.getenv("ORCHESTRATOR_SOCKET", "tmp/orchestrator.sock")
+
     def validate(self):
         """Ensure all required settings are provided"""
         missing = []
@@ -6,28 +6,18 @@ Interactive CLI for running and managing multiple AI agents
 
 import os
 import sys
+import threading
+import time
 import click
 from rich.console import Console
+from rich.live import Live
+from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 from dotenv import load_dotenv
-import importlib # Added import for dynamic loading
-import inspect # Added import for dynamic loading
 from typing import Dict, Any # Keep existing import
-from textwrap import dedent
-
-from agno.agent import Agent
-# from agno.app.fastapi import FastAPIApp
-from fastapi import FastAPI
-from agno.memory.v2 import Memory
-from agno.memory.v2.db.sqlite import SqliteMemoryDb
-from agno.models.openai import OpenAIChat
-from agno.storage.sqlite import SqliteStorage
-from agno.team.team import Team
-from agno.tools.duckduckgo import DuckDuckGoTools
-from agno.tools.exa import ExaTools
-from agno.tools.yfinance import YFinanceTools
+from uuid import uuid4
 
 # Load environment variables
 load_dotenv()
@@ -40,7 +30,21 @@ load_dotenv()
 # from agents.books_recommender.agent import book_agent
 # from agents.travel_agent.agent import travel_agent
 
+from utils.agent_registry import AgentRegistry
+from utils.async_runner import content_delta, get_runner
+from utils import batch_runner
+from utils.broadcast import BroadcastBoard, BroadcastRun, broadcast
+from utils.daemon import OrchestratorDaemon
+from utils.hot_reload import ModuleWatcher
+from utils.jobs import JobManager
+from utils.import_guard import KNOWLEDGE_LOAD, import_agent, release_agent_module
+from utils.instance_cache import AgentInstanceCache
 from utils.logging_config import setup_logging
+from utils.parallel_loader import DEGRADED, FAILED, READY, load_in_parallel
+from utils import startup_profiler
+from utils.startup_profiler import rss_bytes
+from utils.tool_cache import get_tool_cache, install_agent_caches
+from utils.stream_render import MarkdownStreamRenderer
 from config.settings import Settings
 
 
@@ -48,282 +52,397 @@ from config.settings import Settings
 console = Console()
 logger = setup_logging()
 
-agent_storage_file = "tmp/agents.db"
-memory_storage_file = "tmp/memory.db"
-
-memory_db = SqliteMemoryDb(table_name="memory", db_file=memory_storage_file)
-memory = Memory(db=memory_db)
-
-simple_agent = Agent(
-    name="Simple Agent",
-    role="Answer basic questions",
-    agent_id="simple-agent",
-    model=OpenAIChat(id="gpt-4o-mini"),
-    storage=SqliteStorage(
-        table_name="simple_agent", db_file=agent_storage_file, auto_upgrade_schema=True
-    ),
-    memory=memory,
-    enable_user_memories=True,
-    add_history_to_messages=True,
-    num_history_responses=5,
-    add_datetime_to_instructions=True,
-    markdown=True,
-)
-
-web_agent = Agent(
-    name="Web Agent",
-    role="Search the web for information",
-    agent_id="web-agent",
-    model=OpenAIChat(id="gpt-4o"),
-    tools=[DuckDuckGoTools()],
-    instructions=[
-        "Break down the users request into 2-3 different searches.",
-        "Always include sources",
-    ],
-    storage=SqliteStorage(
-        table_name="web_agent", db_file=agent_storage_file, auto_upgrade_schema=True
-    ),
-    memory=memory,
-    enable_user_memories=True,
-    add_history_to_messages=True,
-    num_history_responses=5,
-    add_datetime_to_instructions=True,
-    markdown=True,
-)
-
-finance_agent = Agent(
-    name="Finance Agent",
-    role="Get financial data",
-    agent_id="finance-agent",
-    model=OpenAIChat(id="gpt-4o"),
-    tools=[
-        YFinanceTools(
-            stock_price=True,
-            analyst_recommendations=True,
-            company_info=True,
-            company_news=True,
-        )
-    ],
-    instructions=["Always use tables to display data"],
-    storage=SqliteStorage(
-        table_name="finance_agent", db_file=agent_storage_file, auto_upgrade_schema=True
-    ),
-    memory=memory,
-    enable_user_memories=True,
-    add_history_to_messages=True,
-    num_history_responses=5,
-    add_datetime_to_instructions=True,
-    markdown=True,
-)
-
-research_agent = Agent(
-    name="Research Agent",
-    role="Research agent",
-    model=OpenAIChat(id="gpt-4o"),
-    instructions=["You are a research agent"],
-    tools=[DuckDuckGoTools(), ExaTools()],
-    agent_id="research_agent",
-    memory=memory,
-    storage=SqliteStorage(
-        table_name="research_agent",
-        db_file=agent_storage_file,
-        auto_upgrade_schema=True,
-    ),
-    enable_user_memories=True,
-)
-
-research_team = Team(
-    name="Research Team",
-    description="A team of agents that research the web",
-    members=[research_agent, simple_agent],
-    model=OpenAIChat(id="gpt-4o"),
-    mode="coordinate",
-    team_id="research-team",
-    success_criteria=dedent("""
-        A comprehensive research report with clear sections and data-driven insights.
-    """),
-    instructions=[
-        "You are the lead researcher of a research team! 🔍",
-    ],
-    memory=memory,
-    enable_user_memories=True,
-    add_datetime_to_instructions=True,
-    show_tool_calls=True,
-    markdown=True,
-    enable_agentic_context=True,
-    storage=SqliteStorage(
-        table_name="research_team",
-        db_file=agent_storage_file,
-        auto_upgrade_schema=True,
-        mode="team",
-    ),
-)
-
-from agents.agent_with_instructions.agent import agent as agent_with_instructions
-from agents.youtube_agent.agent import youtube_agent
-from agents.translation_agent.agent import agent as translation_agent
-from agents.travel_agent.agent import travel_agent
-from agents.thinking_finance_agent.agent import finance_agent as thinking_finance_agent
-from agents.social_media_agent.agent import social_media_agent
-from agents.study_partner.agent import study_partner
-from agents.recipe_rag_image.agent import agent as recipe_rag_image_agent
-from agents.research_agent.agent import research_agent
-from agents.web_extraction_agent.agent import agent as web_extraction_agent
-
-fastapi_app = FastAPI(
-    agents=[
-        simple_agent,
-        web_agent,
-        finance_agent,
-        agent_with_instructions,
-        youtube_agent,
-        translation_agent,
-        travel_agent,
-        thinking_finance_agent,
-        social_media_agent,
-        study_partner,
-        recipe_rag_image_agent,
-        research_agent,
-        web_extraction_agent,
-    ],
-    teams=[research_team],
-    app_id="advanced-app",
-    name="Advanced FastAPI App",
-    description="A FastAPI app for advanced agents",
-    version="0.0.1",
-)
-app = fastapi_app.get_app()
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+# Emoji mapping for known agents (can be extended)
+AGENT_EMOJIS = {
+    'finance_agent': '💰',
+    'youtube_agent': '🎥',
+    'research_agent': '🔬',
+    'movie_recommendation': '🎬',
+    'books_recommendation': '📚',
+    'travel_agent': '🌍',
+    'agent_team': '👥',
+    'agent_with_instructions': '📝',
+    'agent_with_knowledge': '🧠',
+    'agent_with_memory': '💾',
+    'agent_with_reasoning': '🤔',
+    'agent_with_storage': '📦',
+    'agent_with_tools': '🔧',
+    'agno_assist': '✨',
+    'agno_support_agent': '🤝',
+    'airbnb_mcp': '🏠',
+    'basic_agent': '👤',
+    'competitor_analysis': '📊',
+    'deep_knowledge': '📚',
+    'deep_research_agent_exa': '🔍',
+    'finance_agent_with_memory': '💾💰',
+    'legal_consultant': '⚖️',
+    'media_trend_analysis_agent': '📈',
+    'meeting_summarizer_agent': '📝',
+    'my_first_agents': '👶', # This folder contains subfolders, the key will be the subfolder name (level1, level2, etc.)
+    'readme_generator': '📄',
+    'reasoning_finance_agent': '🤔💰',
+    'recipe_creator': '🍳',
+    'recipe_rag_image': '🖼️🍳',
+    'shopping_partner': '🛍️',
+    'social_media_agent': '📱',
+    'study_partner': '📖',
+    'thinking_finance_agent': '🧠💰',
+    'translation_agent': '🗣️',
+    'web_extraction_agent': '🕸️',
+    # Add emojis for nested agents if needed, e.g.,
+    'level1': '1️⃣',
+    'level2': '2️⃣',
+    'level3': '3️⃣',
+}
 
 
 class AgentOrchestrator:
     """Orchestrates multiple Agno agents"""
 
-    def __init__(self):
+    def __init__(self, discover: bool = True):
         self.settings = Settings()
         self.agents = {}
-        self.initialize_agents()
+        # One lock per agent key guards building, knowledge replay, eviction and reload
+        self._agent_locks: Dict[str, threading.RLock] = {}
+        self._agent_locks_lock = threading.Lock()
+        self.runner = get_runner()
+        self.jobs = JobManager(self.runner)
+        self.instances = AgentInstanceCache(
+            max_instances=self.settings.agent_max_instances,
+            idle_seconds=self.settings.agent_idle_seconds,
+            max_rss_mb=self.settings.agent_max_rss_mb,
+        )
+
+        # Add the project root to sys.path if not already there
+        if PROJECT_ROOT not in sys.path:
+             sys.path.insert(0, PROJECT_ROOT)
+        self.registry = AgentRegistry(PROJECT_ROOT)
+
+        if discover:
+            self.initialize_agents()
 
     def initialize_agents(self):
-        """Initialize all available agents by dynamically loading them"""
-        agents_root_dir = os.path.join(os.path.dirname(__file__), 'agents')
+        """Discover all available agents without importing their modules"""
+        agents_root_dir = os.path.join(PROJECT_ROOT, 'agents')
         if not os.path.isdir(agents_root_dir):
             logger.error(f"Agents root directory not found: {agents_root_dir}")
             return
 
-        # Add the project root to sys.path if not already there
-        project_root = os.path.dirname(__file__) # Assuming main.py is at project root
-        if project_root not in sys.path:
-             sys.path.insert(0, project_root)
-
-        # Emoji mapping for known agents (can be extended)
-        emoji_map = {
-            'finance_agent': '💰',
-            'youtube_agent': '🎥',
-            'research_agent': '🔬',
-            'movie_recommendation': '🎬',
-            'books_recommendation': '📚',
-            'travel_agent': '🌍',
-            'agent_team': '👥',
-            'agent_with_instructions': '📝',
-            'agent_with_knowledge': '🧠',
-            'agent_with_memory': '💾',
-            'agent_with_reasoning': '🤔',
-            'agent_with_storage': '📦',
-            'agent_with_tools': '🔧',
-            'agno_assist': '✨',
-            'agno_support_agent': '🤝',
-            'airbnb_mcp': '🏠',
-            'basic_agent': '👤',
-            'competitor_analysis': '📊',
-            'deep_knowledge': '📚',
-            'deep_research_agent_exa': '🔍',
-            'finance_agent_with_memory': '💾💰',
-            'legal_consultant': '⚖️',
-            'media_trend_analysis_agent': '📈',
-            'meeting_summarizer_agent': '📝',
-            'my_first_agents': '👶', # This folder contains subfolders, the key will be the subfolder name (level1, level2, etc.)
-            'readme_generator': '📄',
-            'reasoning_finance_agent': '🤔💰',
-            'recipe_creator': '🍳',
-            'recipe_rag_image': '🖼️🍳',
-            'shopping_partner': '🛍️',
-            'social_media_agent': '📱',
-            'study_partner': '📖',
-            'thinking_finance_agent': '🧠💰',
-            'translation_agent': '🗣️',
-            'web_extraction_agent': '🕸️',
-            # Add emojis for nested agents if needed, e.g.,
-            'level1': '1️⃣',
-            'level2': '2️⃣',
-            'level3': '3️⃣',
+        # Discover agents statically; modules are only imported when selected
+        for manifest in self.registry.discover():
+            self.register_manifest(manifest)
+
+    def register_manifest(self, manifest: Dict[str, Any]) -> bool:
+        """Register an agent from its static manifest without importing it"""
+        agent_key = manifest['agent_key']
+        module_path = manifest['module_path']
+
+        if not manifest['variable']:
+            logger.warning(f"No Agno Agent instance found in {module_path}")
+            console.print(f"[yellow]Warning: No Agno Agent found in {module_path}[/yellow]")
+            return False
+
+        # Handle potential key conflicts if multiple agent.py files are in folders with the same name
+        if agent_key in self.agents:
+            logger.warning(f"Duplicate agent key found: {agent_key}. Skipping module {module_path}")
+            console.print(f"[yellow]Warning: Skipping duplicate agent ID: {agent_key}[/yellow]")
+            return False
+
+        self.agents[agent_key] = self._entry_from_manifest(manifest)
+        logger.info(f"Registered agent: {self.agents[agent_key]['config']['name']} (ID: {agent_key}) from {module_path}")
+        return True
+
+    @staticmethod
+    def _entry_from_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
+        agent_key = manifest['agent_key']
+        return {
+            'config': {
+                'name': manifest['name'] or agent_key.replace('_', ' ').title(),
+                'description': manifest['description'] or "No description available",
+                'emoji': AGENT_EMOJIS.get(agent_key, '❓')
+            },
+            'module_path': manifest['module_path'],
+            'variable': manifest['variable'],
+            'file': manifest['file'],
+            'hash': manifest['hash'],
+            'instance': None, # Imported on first use, see get_agent_instance
+            # Runs go through per-request views, so the interactive session lives here
+            'session_id': str(uuid4()),
         }
 
+    def agent_lock(self, agent_key: str) -> threading.RLock:
+        with self._agent_locks_lock:
+            return self._agent_locks.setdefault(agent_key, threading.RLock())
+
+    def register_agent(self, agent_key: str) -> bool:
+        """Register a single agent by ID, parsing only its own module"""
+        manifest = self.registry.resolve(agent_key)
+        return manifest is not None and self.register_manifest(manifest)
+
+    def load_agent_module(self, agent_key: str, entry: Dict[str, Any] = None, reload: bool = False):
+        """Import the module backing an agent and return its Agent instance"""
+        entry = entry or self.agents[agent_key]
+        module_path = entry['module_path']
+        logger.info(f"Attempting to load agent from module: {module_path}")
+        found_agent, report = import_agent(module_path, entry['variable'], reload=reload)
+        # Demo prompts and downloads are dropped; knowledge loads run before first use
+        entry['pending_loads'] = report.deferred_of(KNOWLEDGE_LOAD)
+        install_agent_caches(found_agent)
+        if self.runner.semantic_cache is not None:
+            self.runner.semantic_cache.register(agent_key, found_agent)
+        return found_agent
+
+    def reload_agent(self, agent_key: str) -> bool:
+        """Re-import one changed agent module and swap it into the registry.
+
+        The entry is replaced as a whole, so runs already holding the old
+        instance finish on it while new lookups get the reloaded one.
+        """
+        with self.agent_lock(agent_key):
+            return self._reload_agent(agent_key)
+
+    def _reload_agent(self, agent_key: str) -> bool:
+        old_entry = self.agents[agent_key]
+        agent_dir = os.path.join(PROJECT_ROOT, os.path.dirname(old_entry['file']))
+        manifest = self.registry.manifest_for(agent_dir)
+        self.registry.save()
+        if manifest['hash'] == old_entry['hash']:
+            return False
+        if not manifest['variable']:
+            logger.error(f"No Agno Agent instance found in {manifest['module_path']} after edit, keeping the old one")
+            return False
+
+        new_entry = self._entry_from_manifest(manifest)
+        new_entry['session_id'] = old_entry['session_id']
+        if old_entry['instance'] is not None:
+            start = time.perf_counter()
+            new_entry['instance'] = self.load_agent_module(agent_key, new_entry, reload=True)
+            new_entry['load_time'] = time.perf_counter() - start
+        self.agents[agent_key] = new_entry
+        if old_entry['instance'] is not None:
+            self.runner.views.discard(old_entry['instance'])
+        logger.info(f"Reloaded agent {agent_key} from {manifest['module_path']}")
+        return True
+
+    def start_hot_reload(self, interval: float = 1.0) -> ModuleWatcher:
+        """Watch agent modules and reload the ones that change"""
+        def on_change(agent_key):
+            try:
+                if self.reload_agent(agent_key):
+                    console.print(f"[dim]♻️  Reloaded {agent_key}[/dim]")
+            except Exception as e:
+                logger.error(f"Failed to reload agent {agent_key}, keeping the old one: {e}")
 
-        # Walk through the agents directory to find agent.py files
-        for root, dirs, files in os.walk(agents_root_dir):
-            if 'agent.py' in files and '__init__.py' in files:
-                # Construct the module path
-                # root will be something like c:\Users\NITRO\Documents\AI\Projects\Test1Agno\Test1Agno\agents\finance_agent
-                # We need the path relative to the project root, then convert to module path
-                relative_root = os.path.relpath(root, project_root) # e.g., agents\finance_agent
-                module_path_parts = relative_root.split(os.sep) # e.g., ['agents', 'finance_agent']
-                module_path = ".".join(module_path_parts) + ".agent" # e.g., agents.finance_agent.agent
+        watcher = ModuleWatcher(
+            lambda: {key: os.path.join(PROJECT_ROOT, entry['file']) for key, entry in self.agents.items()},
+            on_change,
+            interval=interval,
+        )
+        watcher.start()
+        return watcher
+
+    def preload_agents(self, agent_keys=None):
+        """Import agent modules concurrently, marking slow ones as degraded"""
+        agent_keys = [key for key in (agent_keys or self.agents) if self.agents[key]['instance'] is None]
+
+        def build(agent_key):
+            # Under the agent lock, so a concurrent get_agent_instance never imports it twice
+            with self.agent_lock(agent_key):
+                entry = self.agents[agent_key]
+                if entry['instance'] is None:
+                    start = time.perf_counter()
+                    entry['instance'] = self.load_agent_module(agent_key, entry)
+                    self.instances.built(agent_key, time.perf_counter() - start)
+                return entry['instance']
+
+        tasks = {key: (lambda key=key: build(key)) for key in agent_keys}
+
+        def on_late_result(result):
+            self.agents[result.key]['status'] = result.status
+            logger.info(f"Degraded agent {result.key} finished loading late: {result.status}")
+
+        results = load_in_parallel(
+            tasks,
+            max_workers=self.settings.agent_load_workers,
+            timeout=self.settings.agent_load_timeout,
+            on_late_result=on_late_result,
+        )
+        for key, result in results.items():
+            entry = self.agents[key]
+            entry['status'] = result.status
+            entry['load_time'] = result.elapsed
+            if result.status == DEGRADED:
+                logger.warning(f"Agent {key} did not load within {self.settings.agent_load_timeout}s, marked degraded")
+            elif result.status != READY:
+                logger.error(f"Failed to import or process agent module {entry['module_path']}: {result.error}")
+        return results
+
+    def display_load_times(self, results):
+        """Display per-module wall-clock load times, slowest first"""
+        table = Table(title="Agent Load Times", show_header=True, header_style="bold magenta")
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Status")
+        table.add_column("Seconds", justify="right")
 
-                # Use the last part of the relative path as the agent key
-                agent_key = module_path_parts[-1] # e.g., finance_agent
+        status_style = {READY: 'green', DEGRADED: 'yellow', FAILED: 'red'}
+        for result in sorted(results.values(), key=lambda r: r.elapsed or 0.0, reverse=True):
+            style = status_style.get(result.status, 'white')
+            elapsed = f"{result.elapsed:.2f}" if result.elapsed is not None else "-"
+            table.add_row(result.key, f"[{style}]{result.status}[/{style}]", elapsed)
 
-                try:
-                    module = importlib.import_module(module_path)
-                    logger.info(f"Attempting to load agent from module: {module_path}")
-
-                    found_agent = None
-                    agent_name = agent_key.replace('_', ' ').title() # Default name from folder
-                    agent_description = "No description available" # Default description
-                    emoji = emoji_map.get(agent_key, '❓') # Get emoji from map
-
-                    # Find an Agent instance within the module
-                    for name, obj in inspect.getmembers(module):
-                        if isinstance(obj, Agent):
-                            found_agent = obj
-                            # Try to get name and description from the agent instance
-                            if hasattr(obj, 'name') and obj.name:
-                                 agent_name = obj.name
-                            if hasattr(obj, 'description') and obj.description:
-                                 agent_description = obj.description
-                            # Found an agent instance, stop searching in this module
-                            break
-
-                    if found_agent:
-                        # Handle potential key conflicts if multiple agent.py files are in folders with the same name
-                        if agent_key in self.agents:
-                             logger.warning(f"Duplicate agent key found: {agent_key}. Skipping module {module_path}")
-                             console.print(f"[yellow]Warning: Skipping duplicate agent ID: {agent_key}[/yellow]")
-                             continue
-
-                        self.agents[agent_key] = {
-                            'config': {
-                                'name': agent_name,
-                                'description': agent_description,
-                                'emoji': emoji
-                            },
-                            'instance': found_agent # Store the instance directly
-                        }
-                        logger.info(f"Registered agent: {agent_name} (ID: {agent_key}) from {module_path}")
-                    else:
-                        logger.warning(f"No Agno Agent instance found in {module_path}")
-                        console.print(f"[yellow]Warning: No Agno Agent found in {module_path}[/yellow]")
+        console.print(table)
+        console.print()
 
-                except Exception as e:
-                    logger.error(f"Failed to import or process agent module {module_path}: {e}")
-                    console.print(f"[red]Warning: Could not load agent from {module_path}: {e}[/red]")
+    def profile_startup(self, sort_by: str = 'total', output_file: str = 'tmp/startup_profile.json'):
+        """Profile import, construction, network and memory cost of startup"""
+        with console.status("[bold green]Profiling startup..."):
+            rows = startup_profiler.profile_startup(self.registry.discover(), PROJECT_ROOT)
+        startup_profiler.write_profile(rows, output_file)
+
+        table = Table(title=f"Startup Profile (sorted by {sort_by})", show_header=True, header_style="bold magenta")
+        table.add_column("Kind", style="dim")
+        table.add_column("Name", style="cyan", no_wrap=True)
+        table.add_column("Import (s)", justify="right")
+        table.add_column("Construct (s)", justify="right")
+        table.add_column("Total (s)", justify="right")
+        table.add_column("Net calls", justify="right")
+        table.add_column("RSS +MB", justify="right")
+        table.add_column("Deferred", justify="right")
+        table.add_column("Status")
+
+        for row in startup_profiler.sort_rows(rows, sort_by):
+            status = row['status'] if row['status'] == 'ok' else f"[red]{row['status']}[/red]"
+            table.add_row(
+                row['kind'],
+                row['name'],
+                f"{row['import_s']:.3f}",
+                f"{row['construct_s']:.3f}" if row['kind'] == 'agent' else "-",
+                f"{row['total_s']:.3f}",
+                str(row['network_calls']),
+                f"{row['rss_mb']:.1f}",
+                str(row['deferred_calls']) if row['kind'] == 'agent' else "-",
+                status,
+            )
+
+        console.print(table)
+        console.print(f"[dim]Profile written to {output_file}[/dim]\n")
+        return rows
 
     def get_agent_instance(self, agent_key: str):
-        """Get agent instance (already loaded during initialization)"""
+        """Get agent instance, importing its module on first use"""
         if agent_key not in self.agents:
             raise ValueError(f"Agent {agent_key} not found")
 
-        # The instance is already loaded during initialization
-        return self.agents[agent_key]['instance']
+        with self.agent_lock(agent_key):
+            entry = self.agents[agent_key]
+            instance = entry['instance']
+            if instance is None:
+                start = time.perf_counter()
+                instance = entry['instance'] = self.load_agent_module(agent_key)
+                self.instances.built(agent_key, time.perf_counter() - start)
+            else:
+                self.instances.hit(agent_key)
+
+            # Replay knowledge base loads that were deferred during the guarded import
+            pending, entry['pending_loads'] = entry.get('pending_loads') or [], []
+            for load in pending:
+                load.replay()
+
+        # Outside the lock: evicting takes other agents' locks
+        self.evict_agents(keep=agent_key)
+        return instance
+
+    def evict_agents(self, keep: str = None):
+        """Release instances that are idle or over the configured budget"""
+        rss_mb = rss_bytes() / (1024 * 1024) if self.instances.max_rss_mb else None
+        for agent_key in self.instances.victims(keep=keep, rss_mb=rss_mb):
+            self.evict_agent(agent_key, blocking=False)
+
+    def evict_agent(self, agent_key: str, blocking: bool = True) -> bool:
+        """Drop an agent instance; it is rebuilt from its module on next use.
+
+        With ``blocking=False`` an agent that is being built, replayed or
+        reloaded is skipped rather than waited for. Returns whether it was evicted.
+        """
+        lock = self.agent_lock(agent_key)
+        if not lock.acquire(blocking=blocking):
+            return False
+        try:
+            entry = self.agents[agent_key]
+            if entry['instance'] is None:
+                return False
+            self.runner.views.discard(entry['instance'])
+            entry['instance'] = None
+            entry['pending_loads'] = []
+            release_agent_module(entry['module_path'])
+            self.instances.evicted(agent_key)
+        finally:
+            lock.release()
+        logger.info(f"Evicted idle agent {agent_key}")
+        return True
+
+    def start_idle_sweeper(self, interval: float = 30.0):
+        """Periodically evict idle agents, for long-running processes"""
+        if not (self.instances.idle_seconds or self.instances.max_rss_mb):
+            return None
+
+        def sweep():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.evict_agents()
+                except Exception as e:
+                    logger.error(f"Idle agent sweep failed: {e}")
+
+        thread = threading.Thread(target=sweep, daemon=True, name="agent-sweeper")
+        thread.start()
+        return thread
+
+    def display_registry_stats(self):
+        """Display instance cache counters"""
+        stats = self.instances.stats()
+        table = Table(title="Agent Registry", show_header=True, header_style="bold magenta")
+        table.add_column("Live", justify="right")
+        table.add_column("Hits", justify="right")
+        table.add_column("Misses", justify="right")
+        table.add_column("Evictions", justify="right")
+        table.add_column("Rebuilds", justify="right")
+        table.add_column("Avg rebuild (s)", justify="right")
+        table.add_row(
+            str(stats['live']), str(stats['hits']), str(stats['misses']),
+            str(stats['evictions']), str(stats['rebuilds']), f"{stats['avg_rebuild_s']:.2f}",
+        )
+        console.print(table)
+
+        if self.runner.cache is not None:
+            cache_stats = self.runner.cache.stats()
+            table = Table(title="Response Cache", show_header=True, header_style="bold magenta")
+            table.add_column("Entries", justify="right")
+            table.add_column("Hits", justify="right")
+            table.add_column("Misses", justify="right")
+            table.add_column("Avg hit (ms)", justify="right")
+            table.add_row(
+                str(cache_stats['entries']), str(cache_stats['hits']), str(cache_stats['misses']),
+                f"{cache_stats['avg_hit_ms']:.1f}",
+            )
+            console.print(table)
+        tool_cache = get_tool_cache()
+        if tool_cache is not None:
+            tool_stats = tool_cache.stats()
+            console.print(f"[bold]Tool cache:[/bold] {tool_stats['entries']} entries, {tool_stats['hits']} hits, "
+                          f"{tool_stats['misses']} misses, {tool_stats['deduplicated']} deduplicated")
+        if self.runner.flights is not None:
+            flight_stats = self.runner.flights.stats()
+            console.print(f"[bold]Coalesced runs:[/bold] {flight_stats['coalesced']} joined "
+                          f"{flight_stats['started']} executions")
+        if self.runner.semantic_cache is not None:
+            semantic_stats = self.runner.semantic_cache.stats()
+            console.print(f"[bold]Semantic cache[/bold] ({', '.join(semantic_stats['agents'])}): "
+                          f"{semantic_stats['hits']} hits, {semantic_stats['misses']} misses")
+        console.print()
 
     def display_welcome(self):
         """Display welcome message and available agents"""
@@ -338,7 +457,7 @@ class AgentOrchestrator:
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Name", style="yellow")
         table.add_column("Description", style="green")
-        # Removed Status column as all agents are loaded on startup now
+        # Agents are imported lazily on selection, so there is no load status to show
 
         # Sort agents by key for consistent display
         sorted_agent_keys = sorted(self.agents.keys())
@@ -367,8 +486,12 @@ class AgentOrchestrator:
                 agent_ids = ", ".join(sorted(self.agents.keys()))
                 console.print(f"• Enter agent ID ({agent_ids})")
                 console.print("• 'list' - Show available agents")
+                console.print("• 'broadcast <id>,<id>,...' - Ask several agents the same question at once")
+                console.print("• 'stats' - Show agent registry counters")
+                console.print("• 'jobs' / 'jobs watch' / 'view <job>' - Background runs")
                 console.print("• 'exit' - Quit the program")
                 console.print()
+                self.announce_finished_jobs()
 
                 choice = Prompt.ask(
                     "[bold cyan]Select an agent or command[/bold cyan]",
@@ -376,11 +499,27 @@ class AgentOrchestrator:
                 ).lower().strip()
 
                 if choice == 'exit':
+                    if self.jobs.active:
+                        console.print(f"[yellow]Abandoning {self.jobs.active} unfinished background job(s)[/yellow]")
                     console.print("[yellow]Goodbye! 👋[/yellow]")
                     break
                 elif choice == 'list':
                     self.display_welcome()
                     continue
+                elif choice == 'stats':
+                    self.display_registry_stats()
+                    continue
+                elif self.handle_job_command(choice):
+                    continue
+                elif choice.startswith('broadcast'):
+                    agent_keys = [key.strip() for key in choice[len('broadcast'):].replace(',', ' ').split()]
+                    unknown = [key for key in agent_keys if key not in self.agents]
+                    if len(agent_keys) < 2 or unknown:
+                        console.print(f"[red]Usage: broadcast <id>,<id>,... (unknown: {', '.join(unknown) or 'none'})[/red]")
+                        continue
+                    query = Prompt.ask("[bold cyan]📣 Prompt[/bold cyan]")
+                    self.broadcast_query(agent_keys, query)
+                    continue
                 elif choice in self.agents:
                     self.interact_with_agent(choice)
                 else:
@@ -400,8 +539,8 @@ class AgentOrchestrator:
         console.print(f"[dim]{config['description']}[/dim]\n")
 
         try:
-            # Agent is already loaded during initialization
-            agent = self.get_agent_instance(agent_key)
+            with console.status(f"[bold green]Loading {config['name']}..."):
+                agent = self.get_agent_instance(agent_key)
 
             console.print(f"[green]✅ {config['name']} is ready![/green]\n")
 
@@ -409,8 +548,11 @@ class AgentOrchestrator:
             while True:
                 console.print("[bold]Agent commands:[/bold]")
                 console.print("• Enter your query")
+                console.print("• '&<query>' - Run the query in the background")
+                console.print("• 'jobs' / 'jobs watch' / 'view <job>' - Background runs")
                 console.print("• 'back' - Return to main menu") # Removed 'examples'
                 console.print()
+                self.announce_finished_jobs()
 
                 query = Prompt.ask(
                     f"[bold cyan]{config['emoji']} {config['name']}[/bold cyan]",
@@ -420,41 +562,88 @@ class AgentOrchestrator:
                 if query.lower() == 'back':
                     break
                 # Removed elif query.lower() == 'examples':
+                elif query.startswith('&'):
+                    job = self.jobs.submit(agent_key, agent, query[1:].strip())
+                    console.print(f"[green]Started job {job.id} in the background[/green]\n")
+                elif self.handle_job_command(query.strip()):
+                    continue
                 else:
-                    self.process_agent_query(agent, query, config)
+                    self.process_agent_query(agent, query, config,
+                                             session_id=self.agents[agent_key]['session_id'])
 
         except Exception as e:
             logger.error(f"Error interacting with agent {agent_key}: {e}")
             console.print(f"[red]Error interacting with agent: {e}[/red]") # Changed message slightly
 
+    def announce_finished_jobs(self):
+        """Report background jobs that finished since the last prompt"""
+        for job in self.jobs.newly_finished():
+            style = 'green' if job.error is None else 'red'
+            console.print(f"[{style}]Job {job.id} ({job.agent_key}) {job.status} after {job.elapsed:.1f}s "
+                          f"- 'view {job.id}' to show it[/{style}]")
+
+    def handle_job_command(self, command: str) -> bool:
+        """Handle 'jobs', 'jobs watch' and 'view <job>'; return False for anything else"""
+        words = command.lower().split()
+        if words == ['jobs']:
+            console.print(self.jobs.table())
+        elif words == ['jobs', 'watch']:
+            # Live job list until every job finishes or Ctrl+C
+            try:
+                with Live(self.jobs, console=console, refresh_per_second=2):
+                    while self.jobs.active:
+                        time.sleep(0.5)
+            except KeyboardInterrupt:
+                pass
+        elif len(words) == 2 and words[0] == 'view' and words[1].isdigit():
+            job = self.jobs.get(int(words[1]))
+            if job is None:
+                console.print(f"[red]No job {words[1]}[/red]")
+            elif not job.finished:
+                console.print(f"[yellow]Job {job.id} is still {job.status} ({len(job.text)} chars so far)[/yellow]")
+            else:
+                config = self.agents[job.agent_key]['config']
+                console.print(f"\n[bold green]✅ Job {job.id}, {config['name']}:[/bold green] [dim]{job.query}[/dim]")
+                if job.error:
+                    console.print(f"[red]{job.error}[/red]")
+                else:
+                    console.print(Markdown(job.text))
+                console.print("-" * 50)
+        else:
+            return False
+        console.print()
+        return True
+
     # Removed show_agent_examples method
     # def show_agent_examples(self, agent_key: str):
     #     """Show examples for a specific agent"""
     #     ...existing code...
 
-    def process_agent_query(self, agent, query: str, config: Dict[str, Any]):
+    async def aprocess_agent_query(self, agent, query: str, session_id: str = None):
+        """Run a query on the shared event loop and return the RunResponse"""
+        return await self.runner.arun(agent, query, session_id=session_id)
+
+    def process_agent_query(self, agent, query: str, config: Dict[str, Any], session_id: str = None):
         """Process a query with the specified agent"""
         try:
             console.print(f"\n[bold blue]Processing with {config['name']}...[/bold blue]")
 
-            # Run the agent query
+            # Structured output (response_model) only makes sense once complete
+            if self.settings.agent_stream and getattr(agent, 'response_model', None) is None:
+                self.stream_agent_query(agent, query, config, session_id=session_id)
+                return
+
+            # Run the agent query on the shared loop; other runs keep progressing meanwhile
             with console.status("[bold green]Thinking..."):
-                # Assuming print_response returns the response object or string
-                # If it prints directly and returns None, this needs adjustment
-                # The original code had `response = agent.print_response(...)` which implies it returns something.
-                response = agent.print_response(query, stream=False)
+                response = self.runner.run(self.aprocess_agent_query(agent, query, session_id))
 
             console.print(f"\n[bold green]✅ Response from {config['name']}:[/bold green]")
-            # Check if response is None or has a specific attribute to print
-            if response is not None:
-                 # Assuming the response object has a 'content' attribute or can be printed directly
-                 # Based on previous examples, agent.print_response seems to handle printing directly when stream=True.
-                 # When stream=False, it might return the final response object.
-                 # Let's assume it returns a string or an object that prints nicely.
-                 console.print(response)
-            else:
-                 # If print_response handles printing directly even with stream=False
-                 pass # Nothing to print here, it was already printed by agent.print_response
+            content = getattr(response, 'content', None)
+            if isinstance(content, str):
+                console.print(Markdown(content) if getattr(agent, 'markdown', False) else content)
+            elif content is not None:
+                # Structured output (response_model) or other content types
+                console.print(content)
 
             console.print("-" * 50)
 
@@ -462,12 +651,113 @@ class AgentOrchestrator:
             logger.error(f"Error processing query: {e}")
             console.print(f"[red]Error processing query: {e}[/red]")
 
+    def stream_agent_query(self, agent, query: str, config: Dict[str, Any], session_id: str = None):
+        """Print the response as it streams in, rendering Markdown incrementally"""
+        console.print(f"\n[bold green]✅ Response from {config['name']}:[/bold green]")
+        renderer = MarkdownStreamRenderer(console, markdown=getattr(agent, 'markdown', False))
+        with renderer:
+            for chunk in self.runner.stream(agent, query, session_id=session_id):
+                content = content_delta(chunk, agent)
+                if content is not None:
+                    renderer.feed(content)
+
+        ttft = renderer.time_to_first_token
+        if ttft is not None:
+            logger.info(f"{config['name']}: first token after {ttft:.2f}s, "
+                        f"{len(renderer.text)} chars in {time.perf_counter() - renderer.started_at:.2f}s")
+        console.print("-" * 50)
+
+    def broadcast_query(self, agent_keys, query: str):
+        """Run ``query`` on several agents concurrently and compare them side by side"""
+        agents = {}
+        with console.status("[bold green]Loading agents..."):
+            for agent_key in agent_keys:
+                agents[agent_key] = self.get_agent_instance(agent_key)
+
+        runs = {}
+        for agent_key in agent_keys:
+            config = self.agents[agent_key]['config']
+            runs[agent_key] = BroadcastRun(agent_key, f"{config['emoji']} {config['name']}")
+
+        board = BroadcastBoard(runs)
+        future = self.runner.submit(broadcast(self.runner, agents, runs, query))
+        with Live(board, console=console, refresh_per_second=4, transient=True):
+            future.result()
+        board.markdown = True
+        console.print(board)
+
+        table = Table(title="Broadcast", show_header=True, header_style="bold magenta")
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Status")
+        table.add_column("First token (s)", justify="right")
+        table.add_column("Total (s)", justify="right")
+        table.add_column("Input tokens", justify="right")
+        table.add_column("Output tokens", justify="right")
+        for run in runs.values():
+            ttft = run.time_to_first_token
+            table.add_row(
+                run.key, run.status, f"{ttft:.2f}" if ttft is not None else "-", f"{run.elapsed:.2f}",
+                str(run.usage.get('input_tokens', '-')), str(run.usage.get('output_tokens', '-')),
+            )
+            logger.info(f"Broadcast {run.key}: {run.status} in {run.elapsed:.2f}s, usage {run.usage}")
+        console.print(table)
+        console.print()
+
+    def run_batch(self, batch_file: str, output_file: str, per_agent_concurrency: int):
+        """Run a JSONL batch of queries, resuming from ``output_file``"""
+        records = batch_runner.read_batch(batch_file)
+        done = batch_runner.completed_ids(output_file)
+        pending = [record for record in records if str(record['id']) not in done]
+        console.print(f"[bold]Batch:[/bold] {len(records)} records, {len(records) - len(pending)} already done, "
+                      f"{len(pending)} to run")
+
+        # Import each agent once up front; the instances stay referenced for the whole batch
+        agents = {}
+        for agent_key in sorted({record['agent'] for record in pending}):
+            try:
+                if agent_key in self.agents or self.register_agent(agent_key):
+                    with console.status(f"[bold green]Loading {agent_key}..."):
+                        agents[agent_key] = self.get_agent_instance(agent_key)
+                else:
+                    logger.error(f"Unknown agent in batch: {agent_key}")
+            except Exception as e:
+                logger.error(f"Failed to load agent {agent_key} for batch: {e}")
+
+        def report(result):
+            style = 'green' if result['status'] == batch_runner.OK else 'red'
+            elapsed = f"{result['elapsed']:.2f}s" if 'elapsed' in result else "-"
+            console.print(f"[{style}]{result['status']:>5}[/{style}] {result['id']} {result['agent']} {elapsed}")
+
+        start = time.perf_counter()
+        results = batch_runner.run_batch(pending, agents, self.runner, output_file,
+                                         per_agent_concurrency=per_agent_concurrency, on_result=report)
+        wall = time.perf_counter() - start
+
+        failed = sum(1 for result in results if result['status'] != batch_runner.OK)
+        rate = len(results) / wall if wall else 0.0
+        console.print(f"\n[bold green]Batch finished:[/bold green] {len(results) - failed} ok, {failed} failed "
+                      f"in {wall:.1f}s ({rate:.2f} queries/s). Results: {output_file}")
+        return failed
+
 
 @click.command()
 @click.option('--agent', '-a', help='Run specific agent directly')
 @click.option('--query', '-q', help='Query to run with the agent')
 @click.option('--config', '-c', help='Configuration file path')
-def main(agent: str = None, query: str = None, config: str = None):
+@click.option('--preload', is_flag=True, help='Import all agent modules concurrently at startup and report load times')
+@click.option('--serve', is_flag=True, help='Serve the FastAPI app instead of running the CLI')
+@click.option('--watch', is_flag=True, help='Reload agents whose agent.py changes without restarting')
+@click.option('--daemon', is_flag=True, help='Run a resident daemon that keeps all agents warm (see client.py)')
+@click.option('--profile-startup', is_flag=True, help='Profile where startup time and memory go, then exit')
+@click.option('--profile-sort', type=click.Choice(list(startup_profiler.SORT_KEYS)), default='total', help='Column to sort the startup profile by')
+@click.option('--profile-output', default='tmp/startup_profile.json', help='JSON file for the startup profile')
+@click.option('--no-stream', is_flag=True, help='Wait for complete responses instead of streaming tokens')
+@click.option('--batch', 'batch_file', help='Run a JSONL file of {"agent", "query", "session_id"} records')
+@click.option('--batch-output', help='JSONL file for batch results, also used to resume (default: <batch>.results.jsonl)')
+@click.option('--batch-concurrency', type=int, help='Concurrent runs per agent in batch mode')
+def main(agent: str = None, query: str = None, config: str = None, preload: bool = False, serve: bool = False,
+         watch: bool = False, daemon: bool = False, profile_startup: bool = False, profile_sort: str = 'total', profile_output: str = 'tmp/startup_profile.json', no_stream: bool = False,
+         batch_file: str = None, batch_output: str = None, batch_concurrency: int = None):
     """
     Agno Unified Agent Project - Main CLI
 
@@ -484,21 +774,62 @@ def main(agent: str = None, query: str = None, config: str = None):
         console.print("[yellow]Please set them in your .env file or environment[/yellow]")
         sys.exit(1)
 
+    if serve:
+        # Imported here so the CLI never pays for the server's agents
+        import server
+        server.serve()
+        return
+
     try:
-        orchestrator = AgentOrchestrator()
+        if profile_startup:
+            AgentOrchestrator(discover=False).profile_startup(profile_sort, profile_output)
+            return
+
+        if daemon:
+            orchestrator = AgentOrchestrator()
+            orchestrator_daemon = OrchestratorDaemon(orchestrator, orchestrator.settings.orchestrator_socket)
+            with console.status("[bold green]Warming up agents..."):
+                results = orchestrator_daemon.warm_up()
+            orchestrator.display_load_times(results)
+            if watch:
+                orchestrator.start_hot_reload()
+            orchestrator.start_idle_sweeper()
+            console.print(f"[green]Daemon listening on {orchestrator_daemon.socket_path}[/green]")
+            orchestrator_daemon.serve_forever()
+            return
+
+        if batch_file:
+            orchestrator = AgentOrchestrator(discover=False)
+            output_file = batch_output or f"{os.path.splitext(batch_file)[0]}.results.jsonl"
+            concurrency = batch_concurrency or orchestrator.settings.agent_batch_concurrency
+            if orchestrator.run_batch(batch_file, output_file, concurrency):
+                sys.exit(1)
+            return
 
         if agent and query:
-            # Direct execution mode
-            if agent not in orchestrator.agents:
+            # Direct execution mode: resolve and import only the requested agent
+            orchestrator = AgentOrchestrator(discover=False)
+            if not orchestrator.register_agent(agent):
                 console.print(f"[red]Unknown agent: {agent}[/red]")
-                console.print(f"Available agents: {list(orchestrator.agents.keys())}")
+                available = [m['agent_key'] for m in orchestrator.registry.discover() if m['variable']]
+                console.print(f"Available agents: {available}")
                 sys.exit(1)
 
+            if no_stream:
+                orchestrator.settings.agent_stream = False
             agent_instance = orchestrator.get_agent_instance(agent)
             config = orchestrator.agents[agent]['config']
-            orchestrator.process_agent_query(agent_instance, query, config)
+            orchestrator.process_agent_query(agent_instance, query, config,
+                                             session_id=orchestrator.agents[agent]['session_id'])
         else:
             # Interactive mode
+            orchestrator = AgentOrchestrator()
+            if no_stream:
+                orchestrator.settings.agent_stream = False
+            if preload:
+                orchestrator.display_load_times(orchestrator.preload_agents())
+            if watch:
+                orchestrator.start_hot_reload()
             orchestrator.run_interactive_mode()
 
     except Exception as e:
@@ -508,11 +839,4 @@ def main(agent: str = None, query: str = None, config: str = None):
 
 
 if __name__ == "__main__":
-    """
-    Now you can reach your agents/teams with the following URLs:
-    - http://localhost:8001/runs?agent_id=simple-agent
-    - http://localhost:8001/runs?agent_id=web-agent
-    - http://localhost:8001/runs?agent_id=finance-agent
-    - http://localhost:8001/runs?team_id=research-team
-    """
-    fastapi_app.serve(app="advanced:app", port=8001, reload=True)
+    main()
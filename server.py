@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Agno Unified Agent Project - FastAPI Server
+App factory for serving agents and teams over HTTP
+
+Run with:
+    uvicorn server:create_app --factory --port 8001
+or:
+    python server.py
+
+Now you can reach your agents/teams with the following URLs:
+- http://localhost:8001/runs?agent_id=simple-agent
+- http://localhost:8001/runs?agent_id=web-agent
+- http://localhost:8001/runs?agent_id=finance-agent
+- http://localhost:8001/runs?team_id=research-team
+
+Concurrent-safe runs, each on its own view of the agent:
+- POST http://localhost:8001/v1/agents/{agent_id}/runs  {"message": "...", "stream": false}
+"""
+
+import os
+import sys
+from textwrap import dedent
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from config.settings import Settings
+from utils.agent_routes import build_agent_router
+from utils.async_runner import get_runner
+from utils.hot_reload import ModuleWatcher
+from utils.import_guard import KNOWLEDGE_LOAD, import_agent
+from utils.logging_config import setup_logging
+from utils.tool_cache import install_agent_caches
+
+logger = setup_logging()
+
+agent_storage_file = "tmp/agents.db"
+memory_storage_file = "tmp/memory.db"
+
+# Agents served from the agents/ package, as (module path, variable name)
+SERVED_AGENT_MODULES = [
+    ("agents.agent_with_instructions.agent", "agent"),
+    ("agents.youtube_agent.agent", "youtube_agent"),
+    ("agents.translation_agent.agent", "agent"),
+    ("agents.travel_agent.agent", "travel_agent"),
+    ("agents.thinking_finance_agent.agent", "finance_agent"),
+    ("agents.social_media_agent.agent", "social_media_agent"),
+    ("agents.study_partner.agent", "study_partner"),
+    ("agents.recipe_rag_image.agent", "agent"),
+    ("agents.research_agent.agent", "research_agent"),
+    ("agents.web_extraction_agent.agent", "agent"),
+]
+
+
+def build_server_agents():
+    """Build the agents and teams defined by the server itself"""
+    from agno.agent import Agent
+    from agno.memory.v2 import Memory
+    from agno.memory.v2.db.sqlite import SqliteMemoryDb
+    from agno.models.openai import OpenAIChat
+    from agno.storage.sqlite import SqliteStorage
+    from agno.team.team import Team
+    from agno.tools.duckduckgo import DuckDuckGoTools
+    from agno.tools.exa import ExaTools
+    from agno.tools.yfinance import YFinanceTools
+
+    memory_db = SqliteMemoryDb(table_name="memory", db_file=memory_storage_file)
+    memory = Memory(db=memory_db)
+
+    simple_agent = Agent(
+        name="Simple Agent",
+        role="Answer basic questions",
+        agent_id="simple-agent",
+        model=OpenAIChat(id="gpt-4o-mini"),
+        storage=SqliteStorage(
+            table_name="simple_agent", db_file=agent_storage_file, auto_upgrade_schema=True
+        ),
+        memory=memory,
+        enable_user_memories=True,
+        add_history_to_messages=True,
+        num_history_responses=5,
+        add_datetime_to_instructions=True,
+        markdown=True,
+    )
+
+    web_agent = Agent(
+        name="Web Agent",
+        role="Search the web for information",
+        agent_id="web-agent",
+        model=OpenAIChat(id="gpt-4o"),
+        tools=[DuckDuckGoTools()],
+        instructions=[
+            "Break down the users request into 2-3 different searches.",
+            "Always include sources",
+        ],
+        storage=SqliteStorage(
+            table_name="web_agent", db_file=agent_storage_file, auto_upgrade_schema=True
+        ),
+        memory=memory,
+        enable_user_memories=True,
+        add_history_to_messages=True,
+        num_history_responses=5,
+        add_datetime_to_instructions=True,
+        markdown=True,
+    )
+
+    finance_agent = Agent(
+        name="Finance Agent",
+        role="Get financial data",
+        agent_id="finance-agent",
+        model=OpenAIChat(id="gpt-4o"),
+        tools=[
+            YFinanceTools(
+                stock_price=True,
+                analyst_recommendations=True,
+                company_info=True,
+                company_news=True,
+            )
+        ],
+        instructions=["Always use tables to display data"],
+        storage=SqliteStorage(
+            table_name="finance_agent", db_file=agent_storage_file, auto_upgrade_schema=True
+        ),
+        memory=memory,
+        enable_user_memories=True,
+        add_history_to_messages=True,
+        num_history_responses=5,
+        add_datetime_to_instructions=True,
+        markdown=True,
+    )
+
+    research_agent = Agent(
+        name="Research Agent",
+        role="Research agent",
+        model=OpenAIChat(id="gpt-4o"),
+        instructions=["You are a research agent"],
+        tools=[DuckDuckGoTools(), ExaTools()],
+        agent_id="research_agent",
+        memory=memory,
+        storage=SqliteStorage(
+            table_name="research_agent",
+            db_file=agent_storage_file,
+            auto_upgrade_schema=True,
+        ),
+        enable_user_memories=True,
+    )
+
+    research_team = Team(
+        name="Research Team",
+        description="A team of agents that research the web",
+        members=[research_agent, simple_agent],
+        model=OpenAIChat(id="gpt-4o"),
+        mode="coordinate",
+        team_id="research-team",
+        success_criteria=dedent("""
+            A comprehensive research report with clear sections and data-driven insights.
+        """),
+        instructions=[
+            "You are the lead researcher of a research team! 🔍",
+        ],
+        memory=memory,
+        enable_user_memories=True,
+        add_datetime_to_instructions=True,
+        show_tool_calls=True,
+        markdown=True,
+        enable_agentic_context=True,
+        storage=SqliteStorage(
+            table_name="research_team",
+            db_file=agent_storage_file,
+            auto_upgrade_schema=True,
+            mode="team",
+        ),
+    )
+
+    for agent in (simple_agent, web_agent, finance_agent, research_team):
+        install_agent_caches(agent)
+    return [simple_agent, web_agent, finance_agent], [research_team]
+
+
+def register_served_agent(module_path: str, agent):
+    """Hook a served agent into the caches; ``agents.<key>.agent`` gives its registry key"""
+    install_agent_caches(agent)
+    semantic_cache = get_runner().semantic_cache
+    if semantic_cache is not None:
+        semantic_cache.register(module_path.split(".")[1], agent)
+
+
+def load_served_agents():
+    """Import the served agent modules without running their demo code"""
+    agents = []
+    for module_path, variable in SERVED_AGENT_MODULES:
+        agent, report = import_agent(module_path, variable)
+        register_served_agent(module_path, agent)
+        # Knowledge bases must be ready before the first request is served
+        for call in report.deferred_of(KNOWLEDGE_LOAD):
+            call.replay()
+        agents.append(agent)
+    return agents
+
+
+def watch_served_agents(agents, first_index: int):
+    """Hot-reload served agent modules, swapping them in place in ``agents``.
+
+    The app's routers look agents up in this same list on every request, so
+    replacing an element takes effect immediately while in-flight runs keep
+    the old instance.
+    """
+    module_index = {module_path: first_index + i for i, (module_path, _) in enumerate(SERVED_AGENT_MODULES)}
+    variables = dict(SERVED_AGENT_MODULES)
+
+    def on_change(module_path):
+        try:
+            agent, report = import_agent(module_path, variables[module_path], reload=True)
+            register_served_agent(module_path, agent)
+            for call in report.deferred_of(KNOWLEDGE_LOAD):
+                call.replay()
+            old_agent = agents[module_index[module_path]]
+            # FastAPIApp assigned the old instance its (possibly random) ID; keep routes pointing at it
+            agent.agent_id = old_agent.agent_id
+            agent.app_id = getattr(old_agent, "app_id", None)
+            agent.initialize_agent()
+            agents[module_index[module_path]] = agent
+            get_runner().views.discard(old_agent)
+            logger.info(f"Reloaded served agent from {module_path}")
+        except Exception as e:
+            logger.error(f"Failed to reload {module_path}, keeping the old agent: {e}")
+
+    watcher = ModuleWatcher(
+        lambda: {
+            module_path: os.path.join(PROJECT_ROOT, *module_path.split(".")) + ".py"
+            for module_path in module_index
+        },
+        on_change,
+    )
+    watcher.start()
+    return watcher
+
+
+def create_app():
+    """Build the FastAPI app serving the server's agents and teams"""
+    from agno.app.fastapi import FastAPIApp
+
+    agents, teams = build_server_agents()
+    first_served_index = len(agents)
+    agents.extend(load_served_agents())
+    if Settings().agent_hot_reload:
+        watch_served_agents(agents, first_served_index)
+
+    fastapi_app = FastAPIApp(
+        agents=agents,
+        teams=teams,
+        app_id="advanced-app",
+        name="Advanced FastAPI App",
+        description="A FastAPI app for advanced agents",
+        version="0.0.1",
+    )
+    app = fastapi_app.get_app()
+    # Per-request agent views, safe for concurrent users of the same agent ID
+    app.include_router(build_agent_router(agents))
+    return app
+
+
+def serve(host: str = "localhost", port: int = 8001, reload: bool = None):
+    """Serve the app factory with uvicorn.
+
+    Full-process reload is the default unless agent hot reload is enabled, in
+    which case only changed agent modules are reloaded.
+    """
+    import uvicorn
+
+    if reload is None:
+        reload = not Settings().agent_hot_reload
+    uvicorn.run("server:create_app", factory=True, host=host, port=port, reload=reload)
+
+
+if __name__ == "__main__":
+    serve()
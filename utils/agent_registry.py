@@ -0,0 +1,186 @@
+"""Static discovery of agent modules.
+
+Agent modules under ``agents/`` run demo code at import time, so importing them
+just to list what is available is expensive. This module reads each
+``agent.py`` with :mod:`ast` instead and extracts a small manifest (variable
+name, ``name`` and ``description`` of the ``Agent(...)`` call). Manifests are
+cached on disk keyed by the file's content hash, so unchanged modules are not
+even re-parsed.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+from textwrap import dedent
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("AgnoUnifiedAgent")
+
+REGISTRY_VERSION = 1
+AGENT_MODULE_FILE = "agent.py"
+
+
+def file_hash(path: str) -> str:
+    """Return the sha256 hex digest of a file's contents"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _call_name(node: ast.AST) -> Optional[str]:
+    """Return the called name for ``Agent(...)`` or ``module.Agent(...)``"""
+    if not isinstance(node, ast.Call):
+        return None
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _literal_string(node: ast.AST, constants: Dict[str, str]) -> Optional[str]:
+    """Resolve a keyword value to a string without executing the module.
+
+    Handles plain literals, ``dedent("...")`` and names bound to a module-level
+    string literal. Anything else (f-strings, function calls) is left unresolved.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if _call_name(node) == "dedent" and node.args:
+        inner = _literal_string(node.args[0], constants)
+        return dedent(inner) if inner is not None else None
+    if isinstance(node, ast.Name):
+        return constants.get(node.id)
+    return None
+
+
+def parse_agent_module(path: str) -> Dict[str, Any]:
+    """Parse an agent module and return its manifest.
+
+    Only top-level assignments are considered. When a module defines several
+    agents, the one whose variable name sorts first is used, matching the
+    ``inspect.getmembers`` order the orchestrator historically relied on.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    constants: Dict[str, str] = {}
+    candidates: List[Dict[str, Any]] = []
+    for stmt in tree.body:
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+            target, value = stmt.targets[0], stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            target, value = stmt.target, stmt.value
+        else:
+            continue
+        if not isinstance(target, ast.Name):
+            continue
+
+        literal = _literal_string(value, constants)
+        if literal is not None:
+            constants[target.id] = literal
+            continue
+
+        if _call_name(value) == "Agent":
+            keywords = {kw.arg: kw.value for kw in value.keywords if kw.arg}
+            candidates.append({
+                "variable": target.id,
+                "name": _literal_string(keywords["name"], constants) if "name" in keywords else None,
+                "description": (
+                    _literal_string(keywords["description"], constants)
+                    if "description" in keywords else None
+                ),
+            })
+
+    if not candidates:
+        return {"variable": None, "name": None, "description": None}
+    return sorted(candidates, key=lambda c: c["variable"])[0]
+
+
+class AgentRegistry:
+    """On-disk cache of agent manifests keyed by module file hash"""
+
+    def __init__(self, project_root: str, registry_file: Optional[str] = None):
+        self.project_root = project_root
+        self.agents_root = os.path.join(project_root, "agents")
+        self.registry_file = registry_file or os.path.join(project_root, "tmp", "agent_registry.json")
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.registry_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == REGISTRY_VERSION:
+            self._entries = data.get("modules", {})
+
+    def save(self):
+        """Persist the registry if any manifest changed"""
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.registry_file), exist_ok=True)
+        tmp_file = f"{self.registry_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": REGISTRY_VERSION, "modules": self._entries}, f, indent=2)
+        os.replace(tmp_file, self.registry_file)
+        self._dirty = False
+
+    def manifest_for(self, agent_dir: str) -> Dict[str, Any]:
+        """Return the manifest for the agent package in ``agent_dir``"""
+        path = os.path.join(agent_dir, AGENT_MODULE_FILE)
+        relative_root = os.path.relpath(agent_dir, self.project_root)
+        module_path_parts = relative_root.split(os.sep)
+        digest = file_hash(path)
+
+        cached = self._entries.get(relative_root)
+        if cached and cached.get("hash") == digest:
+            return cached
+
+        parsed = parse_agent_module(path)
+        manifest = {
+            "agent_key": module_path_parts[-1],
+            "module_path": ".".join(module_path_parts) + ".agent",
+            "file": os.path.join(relative_root, AGENT_MODULE_FILE),
+            "hash": digest,
+            **parsed,
+        }
+        self._entries[relative_root] = manifest
+        self._dirty = True
+        return manifest
+
+    def resolve(self, agent_key: str) -> Optional[Dict[str, Any]]:
+        """Return the manifest for a single agent ID, parsing only that module.
+
+        Top-level packages (``agents/<key>``) are checked directly; nested ones
+        such as ``agents/my_first_agents/level1`` fall back to a directory walk.
+        """
+        candidate = os.path.join(self.agents_root, agent_key)
+        if not os.path.isfile(os.path.join(candidate, AGENT_MODULE_FILE)):
+            candidate = next(
+                (root for root, dirs, files in os.walk(self.agents_root)
+                 if os.path.basename(root) == agent_key and AGENT_MODULE_FILE in files),
+                None,
+            )
+        if candidate is None or not os.path.isfile(os.path.join(candidate, "__init__.py")):
+            return None
+
+        manifest = self.manifest_for(candidate)
+        self.save()
+        return manifest
+
+    def discover(self) -> List[Dict[str, Any]]:
+        """Walk ``agents/`` and return a manifest per agent package"""
+        manifests = []
+        for root, dirs, files in os.walk(self.agents_root):
+            dirs.sort()
+            if AGENT_MODULE_FILE in files and "__init__.py" in files:
+                try:
+                    manifests.append(self.manifest_for(root))
+                except (OSError, SyntaxError) as e:
+                    logger.error(f"Failed to parse agent module in {root}: {e}")
+        self.save()
+        return manifests
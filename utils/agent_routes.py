@@ -0,0 +1,66 @@
+"""HTTP routes that run agents on per-request views.
+
+Mounted next to agno's FastAPIApp routes by ``server.create_app``. Every
+request runs through an :class:`~utils.async_runner.AgentRunner`, which
+checks out a private view of the shared agent and bounds concurrency, so one
+agent ID can serve many concurrent users without their runs interfering.
+"""
+
+import json
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from utils.async_runner import AgentRunner, content_delta, get_runner
+
+
+class AgentRunRequest(BaseModel):
+    message: str
+    session_id: Optional[str] = None
+    user_id: Optional[str] = None
+    stream: bool = False
+
+
+def find_agent(agents: List[Any], agent_id: str) -> Any:
+    """Look an agent up by ID on every request so hot-reloaded agents are picked up"""
+    for agent in agents:
+        if getattr(agent, "agent_id", None) == agent_id:
+            return agent
+    raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
+
+
+def build_agent_router(agents: List[Any], runner: Optional[AgentRunner] = None) -> APIRouter:
+    runner = runner or get_runner()
+    router = APIRouter(prefix="/v1/agents", tags=["agents"])
+
+    @router.get("")
+    async def list_agents():
+        return [
+            {"agent_id": agent.agent_id, "name": agent.name, "description": agent.description}
+            for agent in agents
+        ]
+
+    @router.post("/{agent_id}/runs")
+    async def run_agent(agent_id: str, body: AgentRunRequest):
+        agent = find_agent(agents, agent_id)
+
+        if body.stream:
+            async def event_stream():
+                async for chunk in runner.astream(agent, body.message, session_id=body.session_id, user_id=body.user_id):
+                    content = content_delta(chunk, agent)
+                    if content:
+                        yield json.dumps({"content": content, "session_id": getattr(chunk, "session_id", None)}) + "\n"
+
+            return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+        response = await runner.arun(agent, body.message, session_id=body.session_id, user_id=body.user_id)
+        return {
+            "content": response.content,
+            "run_id": response.run_id,
+            "session_id": response.session_id,
+            "metrics": response.metrics,
+        }
+
+    return router
@@ -0,0 +1,137 @@
+"""Per-request agent views.
+
+An agno ``Agent`` keeps per-run state on itself (``run_response``,
+``session_id``, run messages, the agent bound to each tool ``Function``), so a
+single instance cannot safely serve concurrent requests. A view is a shallow
+copy that shares the expensive, immutable parts (model client, toolkit
+clients, knowledge base, storage engine, v2 memory) and gets its own copy of
+the per-run state only.
+
+:class:`AgentViewPool` recycles released views so repeated requests don't even
+pay for the shallow copies.
+"""
+
+import copy
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+# Attributes reset on every checkout; a missing attribute is simply skipped so
+# the view works across agno versions
+PER_RUN_ATTRIBUTES = {
+    "run_id": None,
+    "run_input": None,
+    "run_response": None,
+    "images": None,
+    "videos": None,
+    "audio": None,
+    "agent_session": None,
+    "session_name": None,
+    "_tools_for_model": None,
+    "_functions_for_model": None,
+    "_rebuild_tools": True,
+}
+# Attributes restored from the template on every checkout. ``Agent.arun`` does
+# ``self.stream = self.stream or stream``, so one streaming run would otherwise
+# leave the view streaming for good.
+TEMPLATE_ATTRIBUTES = ("stream", "stream_intermediate_steps")
+
+
+def _copy_toolkit(tool: Any) -> Any:
+    """Copy a toolkit's Function wrappers, sharing the toolkit's clients"""
+    functions = getattr(tool, "functions", None)
+    if not isinstance(functions, dict):
+        return tool
+    tool_view = copy.copy(tool)
+    tool_view.functions = {name: copy.copy(function) for name, function in functions.items()}
+    return tool_view
+
+
+def prepare_template(agent: Any):
+    """Initialize ``agent`` before its first view is made.
+
+    agno creates an agent's v2 ``Memory`` lazily on its first run. Views of an
+    uninitialized template would each create their own, splitting the
+    in-process history of agents without storage across views.
+    """
+    if getattr(agent, "memory", True) is not None:
+        return
+    initialize = getattr(agent, "initialize_agent", None) or getattr(agent, "initialize_team", None)
+    if initialize is not None:
+        initialize()
+
+
+def make_view(agent: Any) -> Any:
+    """Return a lightweight copy of ``agent`` with private per-run state"""
+    view = copy.copy(agent)
+    if getattr(agent, "model", None) is not None:
+        # Models keep tool/function state per run; the HTTP client stays shared
+        view.model = copy.copy(agent.model)
+    if getattr(agent, "tools", None):
+        view.tools = [_copy_toolkit(tool) for tool in agent.tools]
+    return view
+
+
+def reset_view(view: Any, template: Any, session_id: Optional[str] = None, user_id: Optional[str] = None):
+    """Clear per-run state on ``view`` and bind it to a session"""
+    for attribute, default in PER_RUN_ATTRIBUTES.items():
+        if hasattr(view, attribute):
+            setattr(view, attribute, default)
+    for attribute in TEMPLATE_ATTRIBUTES:
+        if hasattr(template, attribute):
+            setattr(view, attribute, getattr(template, attribute))
+    if hasattr(view, "session_state"):
+        view.session_state = copy.deepcopy(getattr(template, "session_state", None))
+
+    memory = getattr(template, "memory", None)
+    if memory is not None and type(memory).__name__ == "AgentMemory":
+        # v1 memory stores the run history in process; v2 Memory is DB-backed and shared
+        view.memory = memory.deep_copy() if hasattr(memory, "deep_copy") else copy.deepcopy(memory)
+    view.session_id = session_id or getattr(template, "session_id", None) or str(uuid4())
+    view.user_id = user_id or getattr(template, "user_id", None)
+
+
+class AgentViewPool:
+    """Hand out per-request views of shared agents, recycling released ones"""
+
+    def __init__(self, max_idle_per_agent: int = 8):
+        self.max_idle_per_agent = max_idle_per_agent
+        # Keyed by id(); the agent itself is kept to detect a reused id after hot reload
+        self._idle: Dict[int, Tuple[Any, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, agent: Any, session_id: Optional[str] = None, user_id: Optional[str] = None) -> Any:
+        with self._lock:
+            owner, idle = self._idle.get(id(agent), (None, []))
+            if owner is not agent:
+                prepare_template(agent)
+                self._idle[id(agent)] = (agent, [])
+            view = idle.pop() if owner is agent and idle else None
+        if view is None:
+            view = make_view(agent)
+        reset_view(view, agent, session_id=session_id, user_id=user_id)
+        return view
+
+    def release(self, agent: Any, view: Any):
+        with self._lock:
+            owner, idle = self._idle.get(id(agent), (None, []))
+            # A run that outlived discard() must not bring the agent back into the pool
+            if owner is agent and len(idle) < self.max_idle_per_agent:
+                idle.append(view)
+
+    def discard(self, agent: Any):
+        """Drop the idle views of an agent that is being evicted or replaced"""
+        with self._lock:
+            owner, _ = self._idle.get(id(agent), (None, []))
+            if owner is agent:
+                del self._idle[id(agent)]
+
+    @contextmanager
+    def checkout(self, agent: Any, session_id: Optional[str] = None, user_id: Optional[str] = None):
+        """Yield a private view of ``agent`` for the duration of one run"""
+        view = self.acquire(agent, session_id=session_id, user_id=user_id)
+        try:
+            yield view
+        finally:
+            self.release(agent, view)
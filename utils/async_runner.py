@@ -0,0 +1,297 @@
+"""Asyncio execution path for agent runs.
+
+All agent runs go through one :class:`AgentRunner`, which
+
+- runs ``Agent.arun`` on a shared event loop (a daemon thread) so the CLI,
+  the daemon and batch jobs overlap their network waits instead of queuing,
+- bounds the number of concurrent runs with a semaphore,
+- runs each call on its own :mod:`agent view <utils.agent_views>`, so
+  concurrent runs of the same agent don't share per-run state,
+- answers repeated prompts from an optional
+  :class:`~utils.response_cache.ResponseCache` (and similar ones from an
+  optional :class:`~utils.semantic_cache.SemanticCache`) without calling the
+  model, and
+- coalesces identical concurrent runs (same agent, session, user and
+  prompt) into one execution (:mod:`utils.single_flight`).
+
+Coroutines can also be awaited directly on another loop (e.g. uvicorn's); the
+concurrency limit is then enforced per loop.
+"""
+
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, Iterator, Optional
+
+from utils.agent_views import AgentViewPool
+from utils.response_cache import normalize_prompt
+from utils.single_flight import SingleFlight
+
+logger = logging.getLogger("AgnoUnifiedAgent")
+
+_DONE = object()
+
+
+class AgentRunner:
+    """Run agents asynchronously with bounded concurrency"""
+
+    def __init__(self, max_concurrency: int = 8, views: Optional[AgentViewPool] = None, cache=None,
+                 semantic_cache=None, single_flight: bool = True):
+        self.max_concurrency = max_concurrency
+        self.views = views or AgentViewPool()
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.flights = SingleFlight() if single_flight else None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The shared event loop, started on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, daemon=True, name="agent-runner").start()
+            return self._loop
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _lookup(self, agent: Any, message: str, kwargs: Dict[str, Any]):
+        """Return (cached content or None, exact cache key) for a run"""
+        # Runs with media or other extra arguments are never cached
+        if kwargs:
+            return None, None
+        cache_key = self.cache.key(agent, message) if self.cache is not None else None
+        if cache_key is not None:
+            content = self.cache.get(cache_key)
+            if content is not None:
+                return content, cache_key
+        if self.semantic_cache is not None and self.semantic_cache.enabled_for(agent):
+            # Embedding the prompt is a blocking HTTP call
+            loop = asyncio.get_running_loop()
+            try:
+                content = await loop.run_in_executor(None, self.semantic_cache.lookup, agent, message)
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed: {e}")
+                content = None
+            if content is not None:
+                return content, cache_key
+        return None, cache_key
+
+    async def _store(self, agent: Any, message: str, cache_key: Optional[str], content: str, kwargs: Dict[str, Any]):
+        if not content or kwargs:
+            return
+        if cache_key is not None:
+            self.cache.put(cache_key, getattr(agent, "name", None), content)
+        if self.semantic_cache is not None and self.semantic_cache.enabled_for(agent):
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, self.semantic_cache.store, agent, message, content)
+            except Exception as e:
+                logger.warning(f"Semantic cache store failed: {e}")
+
+    @staticmethod
+    def _cached_response(agent: Any, content: str, session_id: Optional[str]) -> Any:
+        from agno.run.response import RunResponse
+
+        model = getattr(agent, "model", None)
+        return RunResponse(
+            content=content,
+            agent_id=getattr(agent, "agent_id", None),
+            session_id=session_id,
+            model=getattr(model, "id", None),
+        )
+
+    def _flight_key(self, agent: Any, message: str, session_id: Optional[str], user_id: Optional[str],
+                    kwargs: Dict[str, Any]):
+        # Runs with extra arguments (media, ...) are never shared. Agents with chat history or
+        # memories only share within one session and user, where concurrent identical runs
+        # would see the same state anyway.
+        if self.flights is None or kwargs or not isinstance(message, str):
+            return None
+        return id(agent), session_id, user_id, normalize_prompt(message)
+
+    async def arun(self, agent: Any, message: str, session_id: Optional[str] = None,
+                   user_id: Optional[str] = None, **kwargs) -> Any:
+        """Run ``agent`` on ``message`` and return its RunResponse.
+
+        Identical concurrent runs in one session share one execution.
+        """
+        flight_key = self._flight_key(agent, message, session_id, user_id, kwargs)
+        if flight_key is None:
+            return await self._arun(agent, message, session_id, user_id, **kwargs)
+        return await self.flights.do(flight_key, lambda: self._arun(agent, message, session_id, user_id))
+
+    async def _arun(self, agent: Any, message: str, session_id: Optional[str] = None,
+                    user_id: Optional[str] = None, **kwargs) -> Any:
+        content, cache_key = await self._lookup(agent, message, kwargs)
+        if content is not None:
+            return self._cached_response(agent, content, session_id)
+
+        async with self._semaphore():
+            with self.views.checkout(agent, session_id=session_id, user_id=user_id) as view:
+                response = await view.arun(message, stream=False, **kwargs)
+        if isinstance(getattr(response, "content", None), str):
+            await self._store(agent, message, cache_key, response.content, kwargs)
+        return response
+
+    async def astream(self, agent: Any, message: str, session_id: Optional[str] = None,
+                      user_id: Optional[str] = None, on_response: Optional[Callable[[Any], None]] = None,
+                      **kwargs) -> AsyncIterator[Any]:
+        """Run ``agent`` with streaming and yield its response chunks.
+
+        Streamed chunks carry no run metrics; ``on_response`` receives the
+        view's final RunResponse (with metrics) once the stream is exhausted.
+        Identical concurrent streams in one session share one execution.
+        """
+        flight_key = self._flight_key(agent, message, session_id, user_id, kwargs)
+        if flight_key is None:
+            stream = self._astream(agent, message, session_id, user_id, on_response=on_response, **kwargs)
+        else:
+            stream = self.flights.stream(
+                flight_key,
+                lambda set_result: self._astream(agent, message, session_id, user_id, on_response=set_result),
+                on_result=on_response,
+            )
+        async for chunk in stream:
+            yield chunk
+
+    async def _astream(self, agent: Any, message: str, session_id: Optional[str] = None,
+                       user_id: Optional[str] = None, on_response: Optional[Callable[[Any], None]] = None,
+                       **kwargs) -> AsyncIterator[Any]:
+        content, cache_key = await self._lookup(agent, message, kwargs)
+        if content is not None:
+            response = self._cached_response(agent, content, session_id)
+            yield response
+            if on_response is not None:
+                on_response(response)
+            return
+
+        parts = []
+        async with self._semaphore():
+            with self.views.checkout(agent, session_id=session_id, user_id=user_id) as view:
+                stream = view.arun(message, stream=True, **kwargs)
+                if inspect.isawaitable(stream):
+                    stream = await stream
+                async for chunk in stream:
+                    content = content_delta(chunk, agent)
+                    if content is not None:
+                        parts.append(content)
+                    yield chunk
+                if on_response is not None:
+                    on_response(getattr(view, "run_response", None))
+        await self._store(agent, message, cache_key, "".join(parts), kwargs)
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule ``coro`` on the shared loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine) -> Any:
+        """Run ``coro`` on the shared loop and block until it finishes"""
+        return self.submit(coro).result()
+
+    def stream(self, agent: Any, message: str, **kwargs) -> Iterator[Any]:
+        """Iterate :meth:`astream` from synchronous code"""
+        chunks: "queue.Queue" = queue.Queue()
+
+        async def pump():
+            try:
+                async for chunk in self.astream(agent, message, **kwargs):
+                    chunks.put((chunk, None))
+            except BaseException as e:
+                chunks.put((_DONE, e))
+            else:
+                chunks.put((_DONE, None))
+
+        future = self.submit(pump())
+        try:
+            while True:
+                chunk, error = chunks.get()
+                if error is not None:
+                    raise error
+                if chunk is _DONE:
+                    return
+                yield chunk
+        finally:
+            # The consumer stopped early (Ctrl+C, closed connection): stop the run too
+            future.cancel()
+
+
+# Stream events carrying a piece of the answer; other events (tool calls,
+# reasoning steps, RunCompleted with the whole answer) are not part of the text
+CONTENT_EVENTS = {"RunResponseContent", "TeamRunResponseContent"}
+
+
+def content_delta(chunk: Any, agent: Any = None) -> Optional[str]:
+    """Text a streamed chunk of ``agent``'s run adds to the answer, or None.
+
+    A Team stream also carries its members' events; only the team's own
+    content counts. A complete RunResponse (e.g. from a cache) has no event.
+    """
+    content = getattr(chunk, "content", None)
+    if not isinstance(content, str):
+        return None
+    event = getattr(chunk, "event", None)
+    if event is None:
+        return content
+    event = getattr(event, "value", event)
+    if hasattr(agent, "members") and event != "TeamRunResponseContent":
+        return None
+    return content if event in CONTENT_EVENTS else None
+
+
+def token_usage(response: Any) -> Dict[str, int]:
+    """Sum the token counters of a RunResponse.
+
+    agno records metrics per model call (lists of numbers) on
+    ``RunResponse.metrics``; a missing counter is reported as 0.
+    """
+    metrics = getattr(response, "metrics", None) or {}
+    usage = {}
+    for name in ("input_tokens", "output_tokens", "total_tokens"):
+        value = metrics.get(name, 0) if isinstance(metrics, dict) else getattr(metrics, name, 0)
+        if isinstance(value, (list, tuple)):
+            value = sum(v for v in value if isinstance(v, (int, float)))
+        usage[name] = int(value or 0)
+    return usage
+
+
+_runner: Optional[AgentRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_runner() -> AgentRunner:
+    """Return the process-wide runner, so every entry point shares one loop"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            from config.settings import Settings
+            settings = Settings()
+            cache = None
+            if settings.response_cache:
+                from utils.response_cache import ResponseCache
+                cache = ResponseCache(
+                    ttl_seconds=settings.response_cache_ttl,
+                    max_entries=settings.response_cache_max_entries,
+                    bucket_seconds=settings.response_cache_bucket_seconds,
+                )
+            semantic_cache = None
+            if settings.semantic_cache_agents:
+                from utils.semantic_cache import SemanticCache
+                semantic_cache = SemanticCache(
+                    settings.semantic_cache_agents,
+                    threshold=settings.semantic_cache_threshold,
+                    ttl_seconds=settings.semantic_cache_ttl,
+                )
+            _runner = AgentRunner(max_concurrency=settings.agent_max_concurrency, cache=cache,
+                                  semantic_cache=semantic_cache, single_flight=settings.agent_single_flight)
+        return _runner
@@ -0,0 +1,114 @@
+"""Batch execution of agent queries.
+
+Reads JSONL records of ``{"agent": ..., "query": ..., "session_id": ...}``
+(an optional ``id`` defaults to the 1-based line number) and runs them on the
+shared :class:`~utils.async_runner.AgentRunner` from one warm process. Each
+agent gets its own concurrency limit on top of the runner's global one, so a
+slow agent can't starve the others.
+
+Results are appended to the output JSONL as soon as each run finishes, which
+also makes the output file the checkpoint: rerunning the same batch skips the
+records that already have an ``ok`` result and retries the rest.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from utils.async_runner import AgentRunner, token_usage
+
+OK = "ok"
+ERROR = "error"
+
+
+def read_batch(path: str) -> List[Dict[str, Any]]:
+    """Read batch records, giving each one an ``id``"""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if "agent" not in record or "query" not in record:
+                raise ValueError(f"{path}:{line_number}: a record needs 'agent' and 'query'")
+            record.setdefault("id", line_number)
+            records.append(record)
+    return records
+
+
+def completed_ids(output_path: str) -> Set[str]:
+    """Return the ids that already have a successful result in ``output_path``"""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # A line cut short by an interrupted run
+                continue
+            if result.get("status") == OK:
+                done.add(str(result.get("id")))
+    return done
+
+
+def _content(response: Any) -> Any:
+    content = getattr(response, "content", None)
+    if content is None or isinstance(content, (str, int, float, bool, list, dict)):
+        return content
+    if hasattr(content, "model_dump"):
+        # Structured output (response_model)
+        return content.model_dump(mode="json")
+    return str(content)
+
+
+def run_batch(records: Iterable[Dict[str, Any]], agents: Dict[str, Any], runner: AgentRunner, output_path: str,
+              per_agent_concurrency: int = 2,
+              on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """Run ``records`` and append one result line per record to ``output_path``.
+
+    ``agents`` maps agent keys to loaded agents; records for other keys are
+    written as errors. Returns the results of this invocation in completion
+    order.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    results: List[Dict[str, Any]] = []
+
+    async def run_all(output):
+        limits = {key: asyncio.Semaphore(per_agent_concurrency) for key in agents}
+
+        def write(result):
+            output.write(json.dumps(result, default=str) + "\n")
+            output.flush()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        async def run_one(record):
+            result = {"id": record["id"], "agent": record["agent"], "query": record["query"],
+                      "session_id": record.get("session_id")}
+            agent = agents.get(record["agent"])
+            if agent is None:
+                write({**result, "status": ERROR, "error": f"Unknown agent: {record['agent']}"})
+                return
+            async with limits[record["agent"]]:
+                result["started_at"] = time.time()
+                start = time.perf_counter()
+                try:
+                    response = await runner.arun(agent, record["query"], session_id=record.get("session_id"))
+                except Exception as e:
+                    result.update(status=ERROR, error=str(e))
+                else:
+                    result.update(status=OK, content=_content(response), **token_usage(response))
+                result["elapsed"] = time.perf_counter() - start
+            write(result)
+
+        await asyncio.gather(*(run_one(record) for record in records))
+
+    with open(output_path, "a", encoding="utf-8") as output:
+        runner.run(run_all(output))
+    return results
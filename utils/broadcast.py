@@ -0,0 +1,102 @@
+"""Run one prompt against several agents concurrently.
+
+Every agent streams on the shared runner, so a comparison costs the slowest
+agent's time rather than the sum. :class:`BroadcastBoard` renders the runs side
+by side; while streaming each column shows only the tail of its text, so
+redraws stay cheap however long the answers get.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from rich.markdown import Markdown
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from utils.async_runner import AgentRunner, content_delta, token_usage
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class BroadcastRun:
+    """Progress and metrics of one agent's run"""
+
+    def __init__(self, key: str, title: str):
+        self.key = key
+        self.title = title
+        self.status = RUNNING
+        self.text = ""
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.usage: Dict[str, int] = {}
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+async def broadcast(runner: AgentRunner, agents: Dict[str, Any], runs: Dict[str, BroadcastRun], query: str):
+    """Stream ``query`` through every agent, updating ``runs`` in place"""
+
+    async def run_one(key: str):
+        run = runs[key]
+
+        def on_response(response):
+            run.usage = token_usage(response)
+
+        run.started_at = time.perf_counter()
+        try:
+            async for chunk in runner.astream(agents[key], query, on_response=on_response):
+                content = content_delta(chunk, agents[key])
+                if content:
+                    if run.first_token_at is None:
+                        run.first_token_at = time.perf_counter()
+                    run.text += content
+        except Exception as e:
+            run.status, run.error = FAILED, str(e)
+        else:
+            run.status = DONE
+        run.finished_at = time.perf_counter()
+
+    await asyncio.gather(*(run_one(key) for key in agents))
+
+
+class BroadcastBoard:
+    """Rich renderable showing broadcast runs side by side"""
+
+    def __init__(self, runs: Dict[str, BroadcastRun], tail_lines: int = 20, markdown: bool = False):
+        self.runs = runs
+        self.tail_lines = tail_lines
+        self.markdown = markdown
+
+    def _panel(self, run: BroadcastRun) -> Panel:
+        style = {RUNNING: "yellow", DONE: "green", FAILED: "red"}[run.status]
+        subtitle = f"{run.elapsed:.1f}s" if run.elapsed is not None else run.status
+        if run.error:
+            body = Text(run.error, style="red")
+        elif self.markdown:
+            body = Markdown(run.text)
+        else:
+            body = Text("\n".join(run.text.splitlines()[-self.tail_lines:]))
+        return Panel(body, title=run.title, subtitle=subtitle, border_style=style)
+
+    def __rich__(self):
+        grid = Table.grid(expand=True, padding=(0, 1))
+        for _ in self.runs:
+            grid.add_column(ratio=1)
+        grid.add_row(*(self._panel(run) for run in self.runs.values()))
+        return grid
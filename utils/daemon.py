@@ -0,0 +1,135 @@
+"""Resident orchestrator daemon.
+
+Keeps an initialized ``AgentOrchestrator`` warm (agent modules imported,
+knowledge bases loaded) and answers queries over a Unix socket, so repeated CLI
+queries skip interpreter, agno and agent startup entirely.
+
+Protocol: the client sends one JSON line per connection and reads JSON lines
+back until a ``done`` or ``error`` message::
+
+    -> {"op": "run", "agent": "finance_agent", "query": "..."}
+    <- {"type": "chunk", "content": "..."}
+    <- {"type": "done", "elapsed": 3.2}
+
+``{"op": "list"}`` returns ``{"type": "agents", "agents": {...}}`` and
+``{"op": "stats"}`` returns the agent instance and response cache counters and
+``{"op": "ping"}`` returns ``{"type": "pong"}``.
+"""
+
+import json
+import logging
+import os
+import socketserver
+import time
+from typing import Any, Dict
+
+from utils.async_runner import content_delta
+from utils.tool_cache import get_tool_cache
+
+logger = logging.getLogger("AgnoUnifiedAgent")
+
+DEFAULT_SOCKET_PATH = "tmp/orchestrator.sock"
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def send(self, message: Dict[str, Any]):
+        self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            op = request.get("op", "run")
+            if op == "ping":
+                self.send({"type": "pong"})
+            elif op == "stats":
+                self.send({"type": "stats", "stats": self.server.orchestrator_daemon.stats()})
+            elif op == "list":
+                self.send({"type": "agents", "agents": self.server.orchestrator_daemon.list_agents()})
+            elif op == "run":
+                self.server.orchestrator_daemon.run_query(request["agent"], request["query"], self.send)
+            else:
+                self.send({"type": "error", "message": f"Unknown op: {op}"})
+        except (BrokenPipeError, ConnectionResetError):
+            logger.info("Daemon client disconnected before the response finished")
+        except Exception as e:
+            logger.error(f"Daemon request failed: {e}")
+            try:
+                self.send({"type": "error", "message": str(e)})
+            except OSError:
+                pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class OrchestratorDaemon:
+    """Serve a warm orchestrator over a Unix socket"""
+
+    def __init__(self, orchestrator, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.orchestrator = orchestrator
+        self.socket_path = socket_path
+
+    def warm_up(self):
+        """Import every agent module and load deferred knowledge bases"""
+        results = self.orchestrator.preload_agents()
+        for key, result in results.items():
+            if result.status == "ready":
+                try:
+                    self.orchestrator.get_agent_instance(key)
+                except Exception as e:
+                    logger.error(f"Failed to prepare agent {key}: {e}")
+        self.orchestrator.evict_agents()
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.orchestrator.instances.stats()
+        cache = self.orchestrator.runner.cache
+        if cache is not None:
+            stats["response_cache"] = cache.stats()
+        tool_cache = get_tool_cache()
+        if tool_cache is not None:
+            stats["tool_cache"] = tool_cache.stats()
+        if self.orchestrator.runner.flights is not None:
+            stats["single_flight"] = self.orchestrator.runner.flights.stats()
+        if self.orchestrator.runner.semantic_cache is not None:
+            stats["semantic_cache"] = self.orchestrator.runner.semantic_cache.stats()
+        return stats
+
+    def list_agents(self) -> Dict[str, Dict[str, Any]]:
+        return {key: entry['config'] for key, entry in self.orchestrator.agents.items()}
+
+    def run_query(self, agent_key: str, query: str, send):
+        """Run ``query`` on ``agent_key`` and stream content chunks through ``send``"""
+        if agent_key not in self.orchestrator.agents:
+            send({"type": "error", "message": f"Unknown agent: {agent_key}"})
+            return
+
+        start = time.perf_counter()
+        agent = self.orchestrator.get_agent_instance(agent_key)
+        # Runs on the orchestrator's shared loop, each on its own agent view
+        for chunk in self.orchestrator.runner.stream(agent, query):
+            content = content_delta(chunk, agent)
+            if content:
+                send({"type": "chunk", "content": content})
+        send({"type": "done", "elapsed": time.perf_counter() - start})
+
+    def serve_forever(self):
+        """Bind the socket and serve until interrupted"""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.socket_path)), exist_ok=True)
+
+        server = _UnixServer(self.socket_path, _RequestHandler)
+        server.orchestrator_daemon = self
+        logger.info(f"Orchestrator daemon listening on {self.socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
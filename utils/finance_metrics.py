@@ -0,0 +1,215 @@
+"""Vectorized price metrics for the finance agents.
+
+Asking the model to derive 52-week ranges, returns or volatility from raw tool
+output is slow, burns tokens and is often wrong. :func:`compute_metrics`
+computes them with NumPy for many tickers at once: closes are aligned into a
+``(tickers, days)`` matrix, right-aligned on the latest bar and NaN-padded, so
+every indicator is a single array expression over all tickers.
+:class:`FinanceMetricsTools` exposes the result as one compact table, read from
+the local :mod:`price store <utils.price_store>`.
+"""
+
+import datetime as dt
+import tempfile
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+from agno.tools import Toolkit
+from agno.utils.log import log_debug
+
+from utils.market_snapshot import fetch_facet, markdown_table
+from utils.price_store import BAR_DTYPE, PriceStore, get_price_store
+
+TRADING_DAYS = 252
+# Bars per return horizon
+HORIZONS = {"1m": 21, "3m": 63, "6m": 126, "1y": 252}
+
+
+def align(series: List[np.ndarray]) -> np.ndarray:
+    """Stack 1-D arrays into a matrix, right-aligned and NaN-padded"""
+    length = max((len(values) for values in series), default=0)
+    matrix = np.full((len(series), length), np.nan)
+    for row, values in enumerate(series):
+        if len(values):
+            matrix[row, length - len(values):] = values
+    return matrix
+
+
+def _window(matrix: np.ndarray, bars: int) -> np.ndarray:
+    return matrix[:, -bars:] if matrix.shape[1] else matrix
+
+
+def _rolling_mean(close: np.ndarray, bars: int) -> np.ndarray:
+    window = _window(close, bars)
+    enough = np.sum(~np.isnan(window), axis=1) >= bars
+    with np.errstate(invalid="ignore"):
+        return np.where(enough, np.nanmean(window, axis=1), np.nan)
+
+
+def compute_metrics(close: np.ndarray, high: np.ndarray, low: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute indicators for every row (ticker) of aligned price matrices.
+
+    Tickers without bars get NaN for every indicator.
+    """
+    if close.shape[1] == 0:
+        # No ticker has any bars; a single NaN column yields NaN everywhere
+        close = high = low = np.full((len(close), 1), np.nan)
+    # All-NaN rows (tickers without data) make the nan-reductions warn
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        last = close[:, -1]
+        metrics = {"last": last}
+
+        for name, bars in HORIZONS.items():
+            if close.shape[1] > bars:
+                metrics[f"return_{name}"] = (last / close[:, -1 - bars] - 1) * 100
+            else:
+                metrics[f"return_{name}"] = np.full(len(close), np.nan)
+
+        year_high = np.nanmax(_window(high, TRADING_DAYS), axis=1)
+        year_low = np.nanmin(_window(low, TRADING_DAYS), axis=1)
+        metrics["high_52w"] = year_high
+        metrics["low_52w"] = year_low
+        metrics["from_high_pct"] = (last / year_high - 1) * 100
+
+        log_returns = np.diff(np.log(_window(close, TRADING_DAYS + 1)), axis=1)
+        metrics["volatility_pct"] = np.nanstd(log_returns, axis=1, ddof=1) * np.sqrt(TRADING_DAYS) * 100
+
+        metrics["sma_50"] = _rolling_mean(close, 50)
+        metrics["sma_200"] = _rolling_mean(close, 200)
+        metrics["vs_sma_200_pct"] = (last / metrics["sma_200"] - 1) * 100
+
+        year = _window(close, TRADING_DAYS)
+        # fmax ignores NaN padding, so the running peak starts at each ticker's first bar
+        peaks = np.fmax.accumulate(year, axis=1)
+        metrics["max_drawdown_pct"] = np.nanmin(year / peaks - 1, axis=1) * 100
+    return metrics
+
+
+VALUATION_FIELDS = ("pe", "forward_pe", "eps", "dividend_yield", "market_cap")
+
+_private_store: Optional[PriceStore] = None
+_private_dir: Optional[tempfile.TemporaryDirectory] = None
+_private_store_lock = threading.Lock()
+
+
+def _fallback_store() -> PriceStore:
+    """Throwaway store for this process, used when the price store is disabled.
+
+    Its temporary directory is removed at interpreter exit.
+    """
+    global _private_store, _private_dir
+    with _private_store_lock:
+        if _private_store is None:
+            _private_dir = tempfile.TemporaryDirectory(prefix="price_store_")
+            _private_store = PriceStore(_private_dir.name)
+        return _private_store
+
+
+def _history(symbol: str, start: dt.date) -> np.ndarray:
+    store = get_price_store() or _fallback_store()
+    try:
+        return store.history(symbol, start)
+    except Exception as e:
+        log_debug(f"No price history for {symbol}: {e}")
+        return np.zeros(0, dtype=BAR_DTYPE)
+
+
+def _info(symbol: str) -> dict:
+    try:
+        return fetch_facet(symbol, "info") or {}
+    except Exception as e:
+        log_debug(f"No company info for {symbol}: {e}")
+        return {}
+
+
+def collect_metrics(symbols: List[str], include_valuation: bool = True, max_workers: int = 16) -> Dict[str, np.ndarray]:
+    """Fetch prices (and valuation) for ``symbols`` concurrently and compute every metric.
+
+    Returns one array per metric, aligned with ``symbols``; ``has_history``
+    marks tickers with any price data.
+    """
+    start = dt.date.today() - dt.timedelta(days=400)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as pool:
+        histories = list(pool.map(lambda symbol: _history(symbol, start), symbols))
+        infos = list(pool.map(_info, symbols)) if include_valuation else [{}] * len(symbols)
+
+    metrics = compute_metrics(
+        align([bars["close"] for bars in histories]),
+        align([bars["high"] for bars in histories]),
+        align([bars["low"] for bars in histories]),
+    )
+    metrics["has_history"] = np.array([len(bars) > 0 for bars in histories])
+    for field in VALUATION_FIELDS:
+        metrics[field] = np.array([info.get(field) or np.nan for info in infos], dtype=float)
+    with np.errstate(invalid="ignore"):
+        pe = metrics["pe"]
+        metrics["pe_vs_median"] = pe / np.nanmedian(pe) if np.isfinite(pe).any() else pe
+    return metrics
+
+
+def format_value(value: Optional[float], digits: int = 2) -> str:
+    """Table cell for a metric; missing values (None, NaN) render as "-"."""
+    if value is None or not np.isfinite(value):
+        return "-"
+    return f"{value:,.{digits}f}"
+
+
+class FinanceMetricsTools(Toolkit):
+    def __init__(self, include_valuation: bool = True, max_workers: int = 16, **kwargs):
+        self.include_valuation = include_valuation
+        self.max_workers = max_workers
+        super().__init__(
+            name="finance_metrics_tools",
+            tools=[self.get_price_metrics],
+            instructions=(
+                "Use get_price_metrics for returns, 52-week ranges, volatility, moving averages, drawdowns "
+                "and P/E comparisons instead of computing them from raw prices yourself."
+            ),
+            add_instructions=True,
+            **kwargs,
+        )
+
+    def get_price_metrics(self, symbols: List[str]) -> str:
+        """Use this function to get precomputed price and valuation metrics for one or more stocks.
+
+        Computes, per symbol: last close, returns over 1 month, 3 months, 6 months and 1 year,
+        52-week high and low, distance from the 52-week high, annualized volatility, 50- and 200-day
+        moving averages, position versus the 200-day average, 1-year max drawdown, and trailing and
+        forward P/E with each symbol's P/E relative to the group median.
+
+        Args:
+            symbols (List[str]): Stock symbols, e.g. ["NVDA", "AMD", "INTC"].
+
+        Returns:
+            str: A Markdown table with one row per symbol. Percentages are in percent.
+        """
+        symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+        if not symbols:
+            return "Provide at least one symbol."
+        log_debug(f"Computing price metrics for {symbols}")
+
+        metrics = collect_metrics(symbols, self.include_valuation, self.max_workers)
+        if not metrics["has_history"].any():
+            return f"No price data found for {', '.join(symbols)}."
+
+        header = ["Symbol", "Last", "1M %", "3M %", "6M %", "1Y %", "52w Low", "52w High", "From High %",
+                  "Vol % (ann.)", "SMA50", "SMA200", "vs SMA200 %", "Max DD %"]
+        if self.include_valuation:
+            header += ["P/E", "Fwd P/E", "P/E vs median"]
+        rows = []
+        for i, symbol in enumerate(symbols):
+            if not metrics["has_history"][i]:
+                rows.append([symbol] + ["-"] * (len(header) - 1))
+                continue
+            row = [symbol] + [format_value(metrics[name][i]) for name in (
+                "last", "return_1m", "return_3m", "return_6m", "return_1y", "low_52w", "high_52w",
+                "from_high_pct", "volatility_pct", "sma_50", "sma_200", "vs_sma_200_pct", "max_drawdown_pct",
+            )]
+            if self.include_valuation:
+                row += [format_value(metrics[name][i]) for name in ("pe", "forward_pe", "pe_vs_median")]
+            rows.append(row)
+        return markdown_table(header, rows)
@@ -0,0 +1,119 @@
+"""Serve ``FirecrawlTools`` scrapes and crawls from the local page store.
+
+Repeat scrapes of a page within the freshness window are read from the
+:mod:`page store <utils.page_store>`. Firecrawl can't be told which pages of a
+crawl to skip, so a crawl is rebuilt from a (cheap) site map instead: pages
+still fresh in the store are reused and only the remaining ones are scraped.
+When the site can't be mapped, the regular crawl runs and its pages are stored.
+Map and search results go through the shared TTL cache.
+"""
+
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from agno.utils.log import log_debug
+
+from utils.page_store import PageStore, normalize_url
+from utils.tool_cache import ToolCache, cache_toolkit_functions
+
+NAMESPACE = "firecrawl"
+
+TTLS = {
+    "map_website": 6 * 3600,
+    "search": 3600,
+}
+KEY_ATTRS = ("formats", "limit", "search_params")
+
+# Concurrent page scrapes per crawl, kept low for Firecrawl's rate limits
+MAX_WORKERS = 4
+
+
+def is_result(value: Any) -> bool:
+    """Whether a tool result is data rather than an error message"""
+    return not (isinstance(value, str) and value.startswith("Error"))
+
+
+def _source_url(document: Dict[str, Any]) -> Optional[str]:
+    metadata = document.get("metadata") or {}
+    return metadata.get("source_url") or metadata.get("sourceURL") or metadata.get("url")
+
+
+def _scrape(store: PageStore, toolkit: Any, url: str, fetch: Callable[[str], str]) -> Dict[str, Any]:
+    document = store.get(url, toolkit.formats)
+    if document is None:
+        document = json.loads(fetch(url))
+        _, changed = store.put(url, toolkit.formats, document)
+        document["unchanged"] = not changed
+    return document
+
+
+def serve_scrape(store: PageStore, toolkit: Any, original: Callable[..., str]) -> Callable[..., str]:
+    @functools.wraps(original)
+    def scrape_website(url: str) -> str:
+        document = _scrape(store, toolkit, url, original)
+        document.pop("unchanged", None)
+        return json.dumps(document, default=str)
+
+    scrape_website.__page_store__ = True
+    return scrape_website
+
+
+def serve_crawl(store: PageStore, toolkit: Any, original: Callable[..., str]) -> Callable[..., str]:
+    @functools.wraps(original)
+    def crawl_website(url: str, limit: Optional[int] = None) -> str:
+        # Same precedence as FirecrawlTools.crawl_website
+        limit = toolkit.limit or limit or 10
+        try:
+            links = toolkit.app.map(url).links or []
+            unique: Dict[str, str] = {}
+            for page_url in [url] + [getattr(link, "url", link) for link in links]:
+                unique.setdefault(normalize_url(page_url), page_url)
+            urls: List[str] = list(unique.values())[:limit]
+        except Exception as e:
+            log_debug(f"Could not map {url}, running a full crawl: {e}")
+            result = original(url, limit=limit)
+            for document in json.loads(result).get("data") or []:
+                if _source_url(document):
+                    store.put(_source_url(document), toolkit.formats, document)
+            return result
+
+        pages, errors = [], []
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(urls))) as pool:
+            futures = {page_url: pool.submit(_scrape, store, toolkit, page_url, toolkit.scrape_website)
+                       for page_url in urls}
+            for page_url, future in futures.items():
+                try:
+                    pages.append(future.result())
+                except Exception as e:
+                    errors.append({"url": page_url, "error": str(e)})
+
+        fetched = [page for page in pages if "unchanged" in page]
+        log_debug(f"Crawled {url}: {len(pages) - len(fetched)} pages from the page store, {len(fetched)} scraped")
+        return json.dumps({
+            "status": "completed",
+            "total": len(urls),
+            "completed": len(pages),
+            "from_page_store": len(pages) - len(fetched),
+            # Re-scraped pages whose content is identical to the stored copy
+            "unchanged": [_source_url(page) for page in fetched if page["unchanged"]],
+            "data": [{key: value for key, value in page.items() if key != "unchanged"} for page in pages],
+            "errors": errors,
+        }, default=str)
+
+    crawl_website.__page_store__ = True
+    return crawl_website
+
+
+def cache_toolkit(toolkit: Any, cache: ToolCache):
+    from utils.page_store import get_page_store
+
+    store = get_page_store()
+    functions = getattr(toolkit, "functions", {})
+    if store is not None:
+        for name, serve in (("scrape_website", serve_scrape), ("crawl_website", serve_crawl)):
+            function = functions.get(name)
+            if function is not None and not getattr(function.entrypoint, "__page_store__", False):
+                function.entrypoint = serve(store, toolkit, function.entrypoint)
+    cache_toolkit_functions(toolkit, cache, NAMESPACE, TTLS, KEY_ATTRS, should_cache=is_result)
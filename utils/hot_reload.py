@@ -0,0 +1,62 @@
+"""Polling file watcher for hot-reloading agent modules.
+
+Uses modification times only, so it needs no extra dependency and costs one
+``os.stat`` per watched file per interval. Callers confirm a real change
+(e.g. by content hash) before doing any expensive work.
+"""
+
+import logging
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger("AgnoUnifiedAgent")
+
+
+class ModuleWatcher:
+    """Call ``on_change(key)`` when the file mapped to ``key`` is modified"""
+
+    def __init__(
+        self,
+        files: Callable[[], Dict[str, str]],
+        on_change: Callable[[str], None],
+        interval: float = 1.0,
+    ):
+        self.files = files
+        self.on_change = on_change
+        self.interval = interval
+        self._mtimes: Dict[str, Optional[float]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[float]:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def poll(self):
+        """Check every watched file once"""
+        for key, path in self.files().items():
+            mtime = self._mtime(path)
+            if key not in self._mtimes:
+                self._mtimes[key] = mtime
+            elif mtime is not None and mtime != self._mtimes[key]:
+                self._mtimes[key] = mtime
+                self.on_change(key)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"Module watcher poll failed: {e}")
+
+    def start(self):
+        self.poll()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="module-watcher")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
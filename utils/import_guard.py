@@ -0,0 +1,224 @@
+"""Side-effect quarantine for importing agent modules.
+
+Most modules under ``agents/`` run demo prompts, download files or load
+knowledge bases at import time. While a module is imported inside
+:func:`registry_load`, those calls are intercepted and recorded instead of
+executed, so loading the registry only costs object construction.
+
+Interception is scoped to the importing thread: the patched methods delegate to
+the originals everywhere else, so agents running in other threads are not
+affected by an import happening concurrently.
+"""
+
+import functools
+import importlib
+import inspect
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("AgnoUnifiedAgent")
+
+_state = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+_listeners: Dict[str, List[Callable]] = {}
+
+KNOWLEDGE_LOAD = "AgentKnowledge.load"
+
+
+def add_listener(target: str, callback: Callable):
+    """Call ``callback(*args, **kwargs)`` after each executed (not deferred) ``target`` call.
+
+    Replayed calls count as executed, so e.g. a knowledge base reloaded after
+    import still notifies ``KNOWLEDGE_LOAD`` listeners.
+    """
+    _listeners.setdefault(target, []).append(callback)
+
+
+def _notify(target: str, args: tuple, kwargs: dict):
+    for callback in _listeners.get(target, ()):
+        try:
+            callback(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Listener for {target} failed: {e}")
+
+
+class DeferredResult:
+    """Stand-in returned by intercepted calls.
+
+    Demo code often inspects the result (``response.audio``,
+    ``result.content``), so every attribute resolves to ``None``, the object
+    is falsy and iterating over it yields nothing.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return None
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def __repr__(self) -> str:
+        return "<deferred>"
+
+
+class DeferredCall:
+    """A call intercepted during a guarded import"""
+
+    def __init__(self, target: str, func: Callable, args: tuple, kwargs: dict):
+        self.target = target
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def replay(self) -> Any:
+        """Execute the original call"""
+        result = self.func(*self.args, **self.kwargs)
+        _notify(self.target, self.args, self.kwargs)
+        return result
+
+    def __repr__(self) -> str:
+        return f"<DeferredCall {self.target}>"
+
+
+class QuarantineReport:
+    """Calls deferred while importing one module"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.deferred: List[DeferredCall] = []
+        self._placeholders: List[Tuple[Any, Any]] = []
+
+    def deferred_of(self, target: str) -> List[DeferredCall]:
+        return [call for call in self.deferred if call.target == target]
+
+    def summary(self) -> str:
+        counts = {}
+        for call in self.deferred:
+            counts[call.target] = counts.get(call.target, 0) + 1
+        return ", ".join(f"{target} x{count}" for target, count in counts.items())
+
+    def _restore_placeholders(self):
+        for obj, previous in self._placeholders:
+            if isinstance(getattr(obj, "run_response", None), DeferredResult):
+                obj.run_response = previous
+        self._placeholders.clear()
+
+
+def _current_report() -> Optional[QuarantineReport]:
+    return getattr(_state, "report", None)
+
+
+def _guard(func: Callable, target: str, sets_run_response: bool = False) -> Callable:
+    """Wrap ``func`` so it is deferred while the calling thread is in registry load mode"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        report = _current_report()
+        if report is None:
+            result = func(*args, **kwargs)
+            _notify(target, args, kwargs)
+            return result
+
+        report.deferred.append(DeferredCall(target, func, args, kwargs))
+        result = DeferredResult()
+        if sets_run_response and args:
+            # Modules read ``agent.run_response`` right after ``print_response``
+            owner = args[0]
+            report._placeholders.append((owner, getattr(owner, "run_response", None)))
+            owner.run_response = result
+        return result
+
+    wrapper.__quarantine_original__ = func
+    return wrapper
+
+
+def _patch(owner: Any, attr: str, target: str, sets_run_response: bool = False):
+    current = getattr(owner, attr)
+    if getattr(current, "__quarantine_original__", None) is None:
+        setattr(owner, attr, _guard(current, target, sets_run_response))
+
+
+def install():
+    """Install the interception wrappers (idempotent)"""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+
+        from agno.agent import Agent
+        from agno.knowledge.agent import AgentKnowledge
+        from agno.team.team import Team
+        import agno.utils.media as media
+
+        _patch(Agent, "print_response", "Agent.print_response", sets_run_response=True)
+        _patch(Agent, "run", "Agent.run", sets_run_response=True)
+        _patch(Team, "print_response", "Team.print_response", sets_run_response=True)
+        _patch(Team, "run", "Team.run", sets_run_response=True)
+        _patch(AgentKnowledge, "load", KNOWLEDGE_LOAD)
+        _patch(media, "download_file", "download_file")
+        _installed = True
+
+
+@contextmanager
+def registry_load(label: str):
+    """Defer import-time side effects raised in this thread while the block runs"""
+    install()
+    report = QuarantineReport(label)
+    previous = _current_report()
+    _state.report = report
+    try:
+        yield report
+    finally:
+        _state.report = previous
+        report._restore_placeholders()
+        if report.deferred:
+            logger.info(f"Deferred import-time calls in {label}: {report.summary()}")
+
+
+def import_agent(module_path: str, variable: Optional[str] = None, reload: bool = False):
+    """Import an agent module in registry load mode.
+
+    Returns the module's ``Agent`` (``variable`` if given and valid, otherwise
+    the first one found) together with the report of deferred calls. With
+    ``reload`` an already imported module is re-executed in place; objects
+    created by the previous execution stay alive while referenced.
+    """
+    from agno.agent import Agent
+
+    with registry_load(module_path) as report:
+        if reload and module_path in sys.modules:
+            module = importlib.reload(sys.modules[module_path])
+        else:
+            module = importlib.import_module(module_path)
+
+    found_agent = getattr(module, variable, None) if variable else None
+    if not isinstance(found_agent, Agent):
+        # The static manifest may be stale; fall back to scanning the module
+        found_agent = next(
+            (obj for _, obj in inspect.getmembers(module) if isinstance(obj, Agent)), None
+        )
+    if found_agent is None:
+        raise ValueError(f"No Agno Agent instance found in {module_path}")
+    return found_agent, report
+
+
+def release_agent_module(module_path: str):
+    """Forget an imported agent module so the objects it created can be freed.
+
+    The module is removed from ``sys.modules`` and from its parent package
+    (agent packages import ``agent`` in their ``__init__``), so the next
+    :func:`import_agent` executes it from scratch.
+    """
+    sys.modules.pop(module_path, None)
+    package_path, _, name = module_path.rpartition(".")
+    package = sys.modules.get(package_path)
+    if package is not None and hasattr(package, name):
+        delattr(package, name)
@@ -0,0 +1,91 @@
+"""LRU bookkeeping for loaded agent instances.
+
+The orchestrator keeps every imported ``Agent`` alive, together with its model
+clients, tools, knowledge handles and last run response. This cache tracks when
+each instance was last used and decides which ones to release under an
+instance-count budget, a resident-memory budget and an idle timeout. Released
+agents are rebuilt from their module on next use.
+
+A budget of ``0`` disables that limit.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+
+class AgentInstanceCache:
+    """Track instance usage and pick eviction victims"""
+
+    def __init__(self, max_instances: int = 0, idle_seconds: float = 0, max_rss_mb: float = 0):
+        self.max_instances = max_instances
+        self.idle_seconds = idle_seconds
+        self.max_rss_mb = max_rss_mb
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+        self._evicted = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rebuilds = 0
+        self.rebuild_seconds = 0.0
+
+    def hit(self, key: str):
+        """Record a lookup served by a live instance"""
+        with self._lock:
+            self.hits += 1
+            self._last_used[key] = time.monotonic()
+            self._last_used.move_to_end(key)
+
+    def built(self, key: str, seconds: float):
+        """Record that an instance was (re)built in ``seconds``"""
+        with self._lock:
+            self.misses += 1
+            if key in self._evicted:
+                self._evicted.discard(key)
+                self.rebuilds += 1
+                self.rebuild_seconds += seconds
+            self._last_used[key] = time.monotonic()
+            self._last_used.move_to_end(key)
+
+    def evicted(self, key: str):
+        with self._lock:
+            if self._last_used.pop(key, None) is not None:
+                self.evictions += 1
+                self._evicted.add(key)
+
+    def victims(self, keep: Optional[str] = None, rss_mb: Optional[float] = None) -> List[str]:
+        """Return keys to evict, least recently used first.
+
+        ``keep`` (usually the agent just requested) is never chosen. Under
+        memory pressure a single extra victim is returned per call, since
+        freed memory is not always returned to the OS immediately.
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [key for key in self._last_used if key != keep]
+            victims = []
+            if self.idle_seconds:
+                victims = [key for key in candidates if now - self._last_used[key] > self.idle_seconds]
+            remaining = [key for key in candidates if key not in victims]
+
+            live = len(self._last_used) - len(victims)
+            while self.max_instances and live > self.max_instances and remaining:
+                victims.append(remaining.pop(0))
+                live -= 1
+            if self.max_rss_mb and rss_mb is not None and rss_mb > self.max_rss_mb and remaining:
+                victims.append(remaining.pop(0))
+            return victims
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "live": len(self._last_used),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "rebuilds": self.rebuilds,
+                "avg_rebuild_s": self.rebuild_seconds / self.rebuilds if self.rebuilds else 0.0,
+            }
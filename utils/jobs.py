@@ -0,0 +1,121 @@
+"""Background agent runs for the interactive CLI.
+
+A job streams its agent's response on the shared runner while the prompt
+stays available, so several long runs (deep research, competitor analysis)
+progress at once in one terminal session. Streamed text accumulates on the
+job, which doubles as its progress indicator.
+"""
+
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from rich.table import Table
+
+from utils.async_runner import AgentRunner, content_delta, token_usage
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    """One background run"""
+
+    def __init__(self, job_id: int, agent_key: str, query: str):
+        self.id = job_id
+        self.agent_key = agent_key
+        self.query = query
+        self.status = QUEUED
+        self.text = ""
+        self.error: Optional[str] = None
+        self.usage: Dict[str, int] = {}
+        self.submitted_at = time.perf_counter()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.announced = False
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at or time.perf_counter()
+        return end - (self.started_at or end)
+
+
+class JobManager:
+    """Submit agent runs in the background and track their progress"""
+
+    def __init__(self, runner: AgentRunner):
+        self.runner = runner
+        self._jobs: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, agent_key: str, agent: Any, query: str) -> Job:
+        """Start streaming ``query`` through ``agent`` and return its job"""
+        with self._lock:
+            job = Job(next(self._ids), agent_key, query)
+            self._jobs[job.id] = job
+        self.runner.submit(self._run(job, agent))
+        return job
+
+    async def _run(self, job: Job, agent: Any):
+        def on_response(response):
+            job.usage = token_usage(response)
+
+        job.started_at, job.status = time.perf_counter(), RUNNING
+        try:
+            async for chunk in self.runner.astream(agent, job.query, on_response=on_response):
+                content = content_delta(chunk, agent)
+                if content is not None:
+                    job.text += content
+        except Exception as e:
+            job.status, job.error = FAILED, str(e)
+        else:
+            job.status = DONE
+        job.finished_at = time.perf_counter()
+
+    def get(self, job_id: int) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    @property
+    def active(self) -> int:
+        return sum(1 for job in self.jobs() if not job.finished)
+
+    def newly_finished(self) -> List[Job]:
+        """Return finished jobs not reported yet, marking them reported"""
+        finished = [job for job in self.jobs() if job.finished and not job.announced]
+        for job in finished:
+            job.announced = True
+        return finished
+
+    def table(self) -> Table:
+        """Job list with progress, as a rich table"""
+        table = Table(title="Background Jobs", show_header=True, header_style="bold magenta")
+        table.add_column("Job", justify="right", style="cyan")
+        table.add_column("Agent", no_wrap=True)
+        table.add_column("Status")
+        table.add_column("Seconds", justify="right")
+        table.add_column("Chars", justify="right")
+        table.add_column("Query / latest output", overflow="ellipsis", no_wrap=True, max_width=60)
+        style = {QUEUED: "dim", RUNNING: "yellow", DONE: "green", FAILED: "red"}
+        for job in self.jobs():
+            lines = job.text.strip().splitlines()
+            latest = job.error or (lines[-1] if job.status == RUNNING and lines else job.query)
+            table.add_row(
+                str(job.id), job.agent_key, f"[{style[job.status]}]{job.status}[/{style[job.status]}]",
+                f"{job.elapsed:.1f}", str(len(job.text)), latest,
+            )
+        return table
+
+    def __rich__(self):
+        return self.table()
@@ -0,0 +1,209 @@
+"""Multi-ticker market snapshot toolkit.
+
+Comparing a few tickers through ``YFinanceTools`` takes one tool call per
+ticker and facet, with an LLM round-trip between batches.
+:class:`MarketSnapshotTools` fetches every requested (ticker, facet) pair
+concurrently and returns one compact Markdown report, so a 3-ticker
+comparison is a single tool call. Each fetch goes through the shared
+:mod:`tool cache <utils.tool_cache>` with the same TTLs as ``YFinanceTools``.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from agno.tools import Toolkit
+from agno.utils.log import log_debug
+
+from utils.tool_cache import call_key, get_tool_cache
+from utils.yfinance_cache import TTLS
+
+FACETS = ("price", "info", "recommendations", "news")
+NAMESPACE = "yfinance-snapshot"
+
+# TTL of each facet, matching the YFinanceTools function it replaces
+FACET_TTLS = {
+    "price": TTLS["get_current_stock_price"],
+    "info": TTLS["get_company_info"],
+    "recommendations": TTLS["get_analyst_recommendations"],
+    "news": TTLS["get_company_news"],
+}
+
+
+def _fetch_price(symbol: str) -> Dict[str, Any]:
+    import yfinance as yf
+
+    fast = yf.Ticker(symbol).fast_info
+    # fast_info returns NumPy scalars; plain floats keep the result JSON-serializable for the cache
+    values = {
+        "price": fast.last_price,
+        "previous_close": fast.previous_close,
+        "year_low": fast.year_low,
+        "year_high": fast.year_high,
+        "market_cap": fast.market_cap,
+    }
+    values = {name: float(value) if value is not None else None for name, value in values.items()}
+    price, previous = values.pop("price"), values.pop("previous_close")
+    return {"price": price, "change_pct": (price / previous - 1) * 100 if price and previous else None, **values}
+
+
+def _fetch_info(symbol: str) -> Dict[str, Any]:
+    import yfinance as yf
+
+    info = yf.Ticker(symbol).info
+    return {
+        "name": info.get("shortName"),
+        "sector": info.get("sector"),
+        "pe": info.get("trailingPE"),
+        "forward_pe": info.get("forwardPE"),
+        "eps": info.get("trailingEps"),
+        "dividend_yield": info.get("dividendYield"),
+        "market_cap": info.get("marketCap"),
+    }
+
+
+def _fetch_recommendations(symbol: str) -> Dict[str, Any]:
+    import yfinance as yf
+
+    recommendations = yf.Ticker(symbol).recommendations
+    if recommendations is None or recommendations.empty:
+        return {}
+    latest = recommendations.iloc[0]
+    return {column: int(latest[column]) for column in ("strongBuy", "buy", "hold", "sell", "strongSell")
+            if column in latest}
+
+
+def _fetch_news(symbol: str, limit: int = 3) -> List[Dict[str, Any]]:
+    import yfinance as yf
+
+    headlines = []
+    for item in (yf.Ticker(symbol).news or [])[:limit]:
+        # Newer yfinance versions nest the article under "content"
+        content = item.get("content", item)
+        provider = content.get("provider") or {}
+        headlines.append({
+            "title": content.get("title"),
+            "publisher": provider.get("displayName") if isinstance(provider, dict) else content.get("publisher"),
+        })
+    return headlines
+
+
+FETCHERS: Dict[str, Callable[[str], Any]] = {
+    "price": _fetch_price,
+    "info": _fetch_info,
+    "recommendations": _fetch_recommendations,
+    "news": _fetch_news,
+}
+
+
+def fetch_facet(symbol: str, facet: str) -> Any:
+    """Fetch one facet of one ticker through the shared tool cache"""
+    cache = get_tool_cache()
+    fetch = FETCHERS[facet]
+    if cache is None:
+        return fetch(symbol)
+    key = call_key(NAMESPACE, fetch, (symbol,), {})
+    return cache.get_or_call(key, FACET_TTLS[facet], lambda: fetch(symbol))
+
+
+def _number(value: Any, digits: int = 2) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, (int, float)) and abs(value) >= 1e9:
+        return f"{value / 1e9:,.1f}B"
+    if isinstance(value, (int, float)):
+        return f"{value:,.{digits}f}"
+    return str(value)
+
+
+class MarketSnapshotTools(Toolkit):
+    def __init__(self, max_workers: int = 16, **kwargs):
+        self.max_workers = max_workers
+        super().__init__(
+            name="market_snapshot_tools",
+            tools=[self.get_market_snapshot],
+            instructions=(
+                "To compare or summarize several tickers, call get_market_snapshot once with all "
+                "symbols and the facets you need instead of calling per-ticker tools repeatedly."
+            ),
+            add_instructions=True,
+            **kwargs,
+        )
+
+    def get_market_snapshot(self, symbols: List[str], facets: Optional[List[str]] = None) -> str:
+        """Use this function to get a side-by-side snapshot of several stocks in one call.
+
+        Args:
+            symbols (List[str]): Stock symbols, e.g. ["AAPL", "GOOGL", "AMZN"].
+            facets (Optional[List[str]]): Any of "price", "info", "recommendations", "news".
+                Defaults to all of them.
+
+        Returns:
+            str: Markdown tables with one row per symbol, plus recent headlines.
+        """
+        symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+        facets = [facet for facet in (facets or FACETS) if facet in FETCHERS]
+        if not symbols or not facets:
+            return "Provide at least one symbol and one of the facets: " + ", ".join(FACETS)
+        log_debug(f"Fetching {facets} for {symbols}")
+
+        pairs = [(symbol, facet) for symbol in symbols for facet in facets]
+        data: Dict[str, Dict[str, Any]] = {symbol: {} for symbol in symbols}
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pairs))) as pool:
+            futures = {pair: pool.submit(fetch_facet, *pair) for pair in pairs}
+            for (symbol, facet), future in futures.items():
+                try:
+                    data[symbol][facet] = future.result()
+                except Exception as e:
+                    errors.append(f"{symbol} {facet}: {e}")
+
+        sections = []
+        if "price" in facets or "info" in facets:
+            header = ["Symbol"]
+            if "info" in facets:
+                header += ["Name", "Sector"]
+            if "price" in facets:
+                header += ["Price", "Change %", "52w Low", "52w High", "Market Cap"]
+            if "info" in facets:
+                header += ["P/E", "Fwd P/E", "EPS", "Div Yield"]
+            rows = []
+            for symbol in symbols:
+                price, info = data[symbol].get("price") or {}, data[symbol].get("info") or {}
+                row = [symbol]
+                if "info" in facets:
+                    row += [_number(info.get("name")), _number(info.get("sector"))]
+                if "price" in facets:
+                    row += [_number(price.get("price")), _number(price.get("change_pct")),
+                            _number(price.get("year_low")), _number(price.get("year_high")),
+                            _number(price.get("market_cap"))]
+                if "info" in facets:
+                    row += [_number(info.get("pe")), _number(info.get("forward_pe")), _number(info.get("eps")),
+                            _number(info.get("dividend_yield"))]
+                rows.append(row)
+            sections.append(markdown_table(header, rows))
+
+        if "recommendations" in facets:
+            header = ["Symbol", "Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"]
+            rows = []
+            for symbol in symbols:
+                counts = data[symbol].get("recommendations") or {}
+                rows.append([symbol] + [_number(counts.get(column), 0)
+                                        for column in ("strongBuy", "buy", "hold", "sell", "strongSell")])
+            sections.append("Analyst recommendations (latest month):\n" + markdown_table(header, rows))
+
+        if "news" in facets:
+            lines = ["Recent headlines:"]
+            for symbol in symbols:
+                for headline in data[symbol].get("news") or []:
+                    lines.append(f"- {symbol}: {headline['title']} ({headline['publisher'] or 'unknown'})")
+            sections.append("\n".join(lines))
+
+        if errors:
+            sections.append("Errors:\n" + "\n".join(f"- {error}" for error in errors))
+        return "\n\n".join(sections)
+
+
+def markdown_table(header: List[str], rows: List[List[str]]) -> str:
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    lines += ["| " + " | ".join(row) + " |" for row in rows]
+    return "\n".join(lines)
@@ -0,0 +1,132 @@
+"""Local store of scraped web pages.
+
+Pages live under ``tmp/page_store``: each distinct page content is written
+once as a gzip-compressed JSON blob named after its SHA-256
+(``blobs/ab/abcdef....json.gz``), and a SQLite index maps ``(url, formats)``
+to the current blob and the time it was fetched. Re-scraping a page whose
+content hasn't changed only refreshes its index entry; no new blob is written.
+
+The hash covers the page content, not Firecrawl's per-request metadata (scrape
+ids, credits used, cache state), which differs on every call.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+# Document fields that describe the request rather than the page
+VOLATILE_METADATA = {
+    "scrape_id", "scrapeId", "cache_state", "cacheState", "cached_at", "cachedAt", "credits_used",
+    "creditsUsed", "proxy_used", "proxyUsed", "concurrency_limited", "concurrencyLimited", "num_pages",
+}
+
+
+def normalize_url(url: str) -> str:
+    """Lower-case scheme and host and drop the fragment, so equivalent URLs share an entry"""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+def content_hash(document: Dict[str, Any]) -> str:
+    content = dict(document)
+    if isinstance(content.get("metadata"), dict):
+        content["metadata"] = {key: value for key, value in content["metadata"].items()
+                               if key not in VOLATILE_METADATA}
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PageStore:
+    """Content-addressed, compressed page documents with a freshness window"""
+
+    def __init__(self, root: str = "tmp/page_store", ttl: float = 86400):
+        self.root = root
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(root, "index.db"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT, formats TEXT, hash TEXT, fetched REAL, PRIMARY KEY (url, formats))"
+        )
+        self._db.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.unchanged = 0
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], digest + ".json.gz")
+
+    @staticmethod
+    def _formats_key(formats: Optional[List[str]]) -> str:
+        return ",".join(sorted(formats or []))
+
+    def get(self, url: str, formats: Optional[List[str]] = None, max_age: Optional[float] = None
+            ) -> Optional[Dict[str, Any]]:
+        """Stored document for ``url``, or None when missing or older than ``max_age`` seconds"""
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            row = self._db.execute("SELECT hash, fetched FROM pages WHERE url = ? AND formats = ?",
+                                   (normalize_url(url), self._formats_key(formats))).fetchone()
+            if row is None or time.time() - row[1] > max_age:
+                self.misses += 1
+                return None
+            try:
+                with gzip.open(self._blob_path(row[0]), "rt", encoding="utf-8") as f:
+                    document = json.load(f)
+            except (OSError, ValueError):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return document
+
+    def put(self, url: str, formats: Optional[List[str]], document: Dict[str, Any]) -> Tuple[str, bool]:
+        """Store a freshly fetched document; returns its hash and whether the content changed"""
+        digest = content_hash(document)
+        path = self._blob_path(digest)
+        with self._lock:
+            key = (normalize_url(url), self._formats_key(formats))
+            row = self._db.execute("SELECT hash FROM pages WHERE url = ? AND formats = ?", key).fetchone()
+            changed = row is None or row[0] != digest
+            if not changed:
+                self.unchanged += 1
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Write-then-rename so concurrent readers never see a partial blob
+                with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+                    json.dump(document, f, default=str)
+                os.replace(path + ".tmp", path)
+            self._db.execute("INSERT OR REPLACE INTO pages (url, formats, hash, fetched) VALUES (?, ?, ?, ?)",
+                             key + (digest, time.time()))
+            self._db.commit()
+        return digest, changed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pages, blobs = self._db.execute("SELECT COUNT(*), COUNT(DISTINCT hash) FROM pages").fetchone()
+            return {"pages": pages, "blobs": blobs, "hits": self.hits, "misses": self.misses,
+                    "unchanged": self.unchanged}
+
+
+_store: Optional[PageStore] = None
+_store_lock = threading.Lock()
+
+
+def get_page_store() -> Optional[PageStore]:
+    """Return the process-wide page store, or None when disabled"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            from config.settings import Settings
+            settings = Settings()
+            if not settings.page_store_path:
+                return None
+            _store = PageStore(settings.page_store_path, settings.page_store_ttl)
+        return _store
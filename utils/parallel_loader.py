@@ -0,0 +1,112 @@
+"""Concurrent loading of independent agent modules.
+
+Each task runs on a daemon worker thread so a module that hangs (a database
+that never answers, a stalled download) can be abandoned without blocking the
+caller or interpreter shutdown. A task that exceeds its timeout is reported as
+``degraded`` and its worker is replaced; if it eventually finishes,
+``on_late_result`` is invoked.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+READY = "ready"
+DEGRADED = "degraded"
+FAILED = "failed"
+
+
+class LoadResult:
+    """Outcome of loading one module"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.status: Optional[str] = None
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.started_at: Optional[float] = None
+        self.elapsed: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"<LoadResult {self.key} {self.status} {self.elapsed}>"
+
+
+def load_in_parallel(
+    tasks: Dict[str, Callable[[], Any]],
+    max_workers: int = 8,
+    timeout: float = 30.0,
+    on_late_result: Optional[Callable[[LoadResult], None]] = None,
+) -> Dict[str, LoadResult]:
+    """Run ``tasks`` concurrently and return a result per key.
+
+    ``timeout`` applies to each task individually, measured from the moment a
+    worker starts it, so queued tasks are not penalised by slow neighbours.
+    Degraded tasks report the time waited, not their eventual completion time.
+    """
+    results = {key: LoadResult(key) for key in tasks}
+    pending: "queue.Queue[str]" = queue.Queue()
+    for key in tasks:
+        pending.put(key)
+
+    lock = threading.Lock()
+    done = threading.Condition(lock)
+
+    def worker():
+        while True:
+            try:
+                key = pending.get_nowait()
+            except queue.Empty:
+                return
+            result = results[key]
+            with lock:
+                result.started_at = time.perf_counter()
+            try:
+                value, error = tasks[key](), None
+            except Exception as e:
+                value, error = None, e
+            elapsed = time.perf_counter() - result.started_at
+
+            with lock:
+                late = result.status == DEGRADED
+                result.value, result.error = value, error
+                result.status = READY if error is None else FAILED
+                if not late:
+                    result.elapsed = elapsed
+                done.notify_all()
+            if late and on_late_result is not None:
+                on_late_result(result)
+
+    def start_worker():
+        threading.Thread(target=worker, daemon=True, name="agent-loader").start()
+
+    for _ in range(max(1, min(max_workers, len(tasks)))):
+        start_worker()
+
+    with lock:
+        while True:
+            now = time.perf_counter()
+            waiting = False
+            next_deadline = None
+            for result in results.values():
+                if result.status is not None:
+                    continue
+                waiting = True
+                if result.started_at is None:
+                    continue
+                deadline = result.started_at + timeout
+                if now >= deadline:
+                    result.status = DEGRADED
+                    result.elapsed = now - result.started_at
+                    # The degraded task keeps its thread busy; replace it so queued tasks still run
+                    if not pending.empty():
+                        start_worker()
+                elif next_deadline is None or deadline < next_deadline:
+                    next_deadline = deadline
+            if not waiting:
+                break
+            # Wake up on completion, on the next deadline, or periodically to
+            # pick up tasks that a worker has just started
+            done.wait(timeout=0.1 if next_deadline is None else min(0.1, next_deadline - now))
+
+    return results
@@ -0,0 +1,239 @@
+"""Local store of daily price history.
+
+Each ticker's daily bars live in ``tmp/price_store/<SYMBOL>.npy`` as a NumPy
+structured array (memory-mapped on read), with a small JSON sidecar recording
+which date range has already been fetched. A request only downloads the parts
+of its range that aren't covered yet, so repeated history questions become
+local reads and extending a window fetches just the new days.
+
+Today's bar is still changing, so it is never counted as covered; it is
+refetched once it is older than ``today_ttl``.
+"""
+
+import datetime as dt
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+BAR_DTYPE = np.dtype([
+    ("date", "datetime64[D]"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+    ("dividends", "f8"),
+    ("splits", "f8"),
+])
+
+# yfinance column for each stored field
+COLUMNS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+    "dividends": "Dividends",
+    "splits": "Stock Splits",
+}
+
+EPOCH = dt.date(1970, 1, 1)
+
+PERIOD_DAYS = {
+    "1mo": 31, "3mo": 92, "6mo": 183,
+    "1y": 366, "2y": 731, "5y": 1827, "10y": 3653,
+}
+# Periods counted in trading days rather than calendar days
+PERIOD_BARS = {"1d": 1, "5d": 5}
+PERIODS = set(PERIOD_DAYS) | set(PERIOD_BARS) | {"ytd", "max"}
+
+# Any window at least this long holds a trading day, so an empty fetch of it is an error
+MIN_TRADING_WINDOW_DAYS = 5
+
+
+def period_start(period: str, today: Optional[dt.date] = None) -> dt.date:
+    """First calendar day covered by a yfinance ``period`` string"""
+    today = today or dt.date.today()
+    if period == "max":
+        return EPOCH
+    if period == "ytd":
+        return dt.date(today.year, 1, 1)
+    if period in PERIOD_BARS:
+        # Enough calendar days to span the bars across weekends and holidays
+        return today - dt.timedelta(days=2 * PERIOD_BARS[period] + 7)
+    if period not in PERIOD_DAYS:
+        raise ValueError(f"Unsupported period: {period}")
+    return today - dt.timedelta(days=PERIOD_DAYS[period])
+
+
+def _fetch_yfinance(symbol: str, start: dt.date, end: dt.date) -> np.ndarray:
+    import yfinance as yf
+
+    frame = yf.Ticker(symbol).history(start=start.isoformat(), end=end.isoformat(), interval="1d")
+    bars = np.zeros(len(frame), dtype=BAR_DTYPE)
+    if len(frame):
+        bars["date"] = np.array([timestamp.date() for timestamp in frame.index], dtype="datetime64[D]")
+        for field, column in COLUMNS.items():
+            if column in frame:
+                bars[field] = frame[column].to_numpy(dtype="f8")
+    return bars
+
+
+def _before_listing(bars: np.ndarray, window_end: dt.date) -> bool:
+    """Whether an empty window predates the ticker's first bar by more than a trading week.
+
+    Such a window is empty because the ticker didn't trade yet, not because
+    the fetch failed, so it can be marked covered.
+    """
+    first = bars["date"][0] if len(bars) else None
+    return first is not None and first >= np.datetime64(window_end, "D") + np.timedelta64(MIN_TRADING_WINDOW_DAYS, "D")
+
+
+class PriceStore:
+    """Incrementally backfilled daily bars per ticker"""
+
+    def __init__(self, root: str = "tmp/price_store",
+                 fetch: Callable[[str, dt.date, dt.date], np.ndarray] = _fetch_yfinance,
+                 today_ttl: float = 15 * 60):
+        self.root = root
+        self.fetch = fetch
+        # Seconds a fetched (still changing) bar for today is served before refetching
+        self.today_ttl = today_ttl
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self.local_reads = 0
+        self.fetches = 0
+        os.makedirs(root, exist_ok=True)
+
+    def _lock(self, symbol: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def _paths(self, symbol: str) -> Tuple[str, str]:
+        base = os.path.join(self.root, symbol.replace("/", "_"))
+        return base + ".npy", base + ".json"
+
+    def _read(self, symbol: str) -> Tuple[np.ndarray, Optional[Dict[str, Any]]]:
+        data_path, meta_path = self._paths(symbol)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return np.zeros(0, dtype=BAR_DTYPE), None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return np.load(data_path, mmap_mode="r"), meta
+
+    def _write(self, symbol: str, bars: np.ndarray, meta: Dict[str, Any]):
+        data_path, meta_path = self._paths(symbol)
+        # Write-then-rename so concurrent readers never see a partial file
+        with open(data_path + ".tmp", "wb") as f:
+            np.save(f, bars)
+        os.replace(data_path + ".tmp", data_path)
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def history(self, symbol: str, start: dt.date, end: Optional[dt.date] = None) -> np.ndarray:
+        """Daily bars for ``symbol`` with ``start <= date < end`` (end defaults to tomorrow)"""
+        symbol = symbol.strip().upper()
+        today = dt.date.today()
+        tomorrow = today + dt.timedelta(days=1)
+        end = end or tomorrow
+
+        with self._lock(symbol):
+            bars, meta = self._read(symbol)
+            covered = (dt.date.fromisoformat(meta["start"]), dt.date.fromisoformat(meta["end"])) if meta else None
+
+            if covered is None:
+                missing = [(start, end)]
+            else:
+                missing = []
+                if start < covered[0]:
+                    missing.append((start, covered[0]))
+                today_fresh = time.time() - meta.get("today_fetched_at", 0) < self.today_ttl
+                if end > covered[1] and not (covered[1] == today and end <= tomorrow and today_fresh):
+                    missing.append((covered[1], end))
+
+            if missing:
+                fetched = [self.fetch(symbol, window_start, window_end) for window_start, window_end in missing]
+                self.fetches += len(fetched)
+                merged = np.concatenate([np.asarray(bars)] + fetched)
+                # Refetched days (today's partial bar) replace the stored ones
+                _, last = np.unique(merged["date"][::-1], return_index=True)
+                bars = merged[::-1][last]
+
+                # Missing windows are adjacent to the covered range, so coverage stays one interval
+                for (window_start, window_end), window_bars in zip(missing, fetched):
+                    if not len(window_bars) and (window_end - window_start).days >= MIN_TRADING_WINDOW_DAYS \
+                            and not _before_listing(bars, window_end):
+                        # Yahoo answers throttling with an empty frame; leave the gap to be fetched again
+                        continue
+                    covered = (min(covered[0], window_start), max(covered[1], window_end)) if covered \
+                        else (window_start, window_end)
+                if covered is not None:
+                    today_fetched_at = meta.get("today_fetched_at", 0) if meta else 0
+                    if any(window_end > today for _, window_end in missing):
+                        today_fetched_at = time.time()
+                    meta = {"start": covered[0].isoformat(), "end": min(covered[1], today).isoformat(),
+                            "today_fetched_at": today_fetched_at}
+                    self._write(symbol, bars, meta)
+            else:
+                self.local_reads += 1
+
+        dates = bars["date"]
+        lo, hi = np.searchsorted(dates, np.datetime64(start, "D")), np.searchsorted(dates, np.datetime64(end, "D"))
+        return np.array(bars[lo:hi])
+
+    def stats(self) -> Dict[str, int]:
+        return {"local_reads": self.local_reads, "fetches": self.fetches}
+
+
+def bars_to_json(bars: np.ndarray) -> str:
+    """Render bars like ``DataFrame.to_json(orient="index")``, keyed by ISO date"""
+    return json.dumps({
+        str(bar["date"]): {
+            column: None if np.isnan(bar[field]) else float(bar[field]) for field, column in COLUMNS.items()
+        }
+        for bar in bars
+    })
+
+
+def serve_history(store: PriceStore, original: Callable[..., str]) -> Callable[..., str]:
+    """Serve ``get_historical_stock_prices`` daily requests from ``store``.
+
+    Other intervals go to ``original`` (the live Yahoo call).
+    """
+    @functools.wraps(original)
+    def get_historical_stock_prices(symbol: str, period: str = "1mo", interval: str = "1d") -> str:
+        if interval != "1d" or period not in PERIODS:
+            return original(symbol, period=period, interval=interval)
+        try:
+            bars = store.history(symbol, period_start(period))
+            if period in PERIOD_BARS:
+                bars = bars[-PERIOD_BARS[period]:]
+            return bars_to_json(bars)
+        except Exception as e:
+            return f"Error fetching historical prices for {symbol}: {e}"
+
+    get_historical_stock_prices.__price_store__ = True
+    return get_historical_stock_prices
+
+
+_store: Optional[PriceStore] = None
+_store_lock = threading.Lock()
+
+
+def get_price_store() -> Optional[PriceStore]:
+    """Return the process-wide price store, or None when disabled"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            from config.settings import Settings
+            settings = Settings()
+            if not settings.price_store_path:
+                return None
+            _store = PriceStore(settings.price_store_path)
+        return _store
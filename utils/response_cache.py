@@ -0,0 +1,258 @@
+"""Exact-match cache for agent responses.
+
+Repeated, stable questions (example topics, study plans, recipes) otherwise
+cost a full LLM round-trip each time. Responses are stored in SQLite, keyed by
+a fingerprint of the agent's effective configuration plus the normalized
+prompt:
+
+- the fingerprint covers the model, instructions, tools, response model and
+  knowledge base version, so changing any of them (including rebuilding or
+  adding to the knowledge base, in this or an earlier process) misses instead
+  of serving a stale answer;
+- agents with ``add_datetime_to_instructions`` also key on a time bucket;
+- agents that read conversation history or memories are never cached, since
+  their answer depends on more than the prompt.
+
+Entries expire after a TTL and the least recently used ones are dropped once
+the cache exceeds its size limit.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from utils import import_guard
+
+# Attributes that make an answer depend on previous runs
+STATEFUL_ATTRIBUTES = (
+    "add_history_to_messages",
+    "read_chat_history",
+    "search_previous_sessions_history",
+    "enable_user_memories",
+    "enable_agentic_memory",
+    "enable_session_summaries",
+    "add_state_in_messages",
+    "enable_agentic_context",
+)
+
+# Time each knowledge base was last rebuilt (recreate or upsert), shared across processes
+KNOWLEDGE_VERSIONS_PATH = "tmp/knowledge_versions.json"
+
+_versions_lock = threading.Lock()
+_loaded_at: Dict[str, float] = {}
+_loaded_at_mtime: Optional[float] = None
+# Vector row counts, read once per process and refreshed on every load
+_row_counts: Dict[str, Optional[int]] = {}
+
+
+def knowledge_identity(knowledge: Any) -> str:
+    """Identify a knowledge base by its storage and sources, which stay the same across processes"""
+    vector_db = getattr(knowledge, "vector_db", None)
+    parts = [type(knowledge).__name__, type(vector_db).__name__]
+    parts += [str(getattr(vector_db, attribute, None)) for attribute in ("table_name", "collection", "uri", "db_url")]
+    parts += [_describe_text(getattr(knowledge, attribute, None)) for attribute in ("urls", "path")]
+    payload = json.dumps(parts, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _row_count(knowledge: Any) -> Optional[int]:
+    try:
+        return knowledge.vector_db.get_count()
+    except Exception:
+        return None
+
+
+def _read_loaded_at():
+    global _loaded_at, _loaded_at_mtime
+    try:
+        mtime = os.path.getmtime(KNOWLEDGE_VERSIONS_PATH)
+    except OSError:
+        return
+    if mtime != _loaded_at_mtime:
+        try:
+            with open(KNOWLEDGE_VERSIONS_PATH) as f:
+                _loaded_at = json.load(f)
+        except (OSError, ValueError):
+            return
+        _loaded_at_mtime = mtime
+
+
+def _on_knowledge_load(knowledge: Any, recreate: bool = False, upsert: bool = False, *args, **kwargs):
+    identity = knowledge_identity(knowledge)
+    row_count = _row_count(knowledge)
+    with _versions_lock:
+        # Added rows show up in the row count; only a rebuild or upsert can change content in place
+        _row_counts[identity] = row_count
+        if not (recreate or upsert):
+            return
+        _read_loaded_at()
+        _loaded_at[identity] = time.time()
+        os.makedirs(os.path.dirname(os.path.abspath(KNOWLEDGE_VERSIONS_PATH)), exist_ok=True)
+        # Write-then-rename so other processes never read a partial file
+        with open(KNOWLEDGE_VERSIONS_PATH + ".tmp", "w") as f:
+            json.dump(_loaded_at, f)
+        os.replace(KNOWLEDGE_VERSIONS_PATH + ".tmp", KNOWLEDGE_VERSIONS_PATH)
+
+
+import_guard.add_listener(import_guard.KNOWLEDGE_LOAD, _on_knowledge_load)
+
+
+def knowledge_version(knowledge: Any) -> str:
+    """Version of a knowledge base: when it was last rebuilt, by any process, and its vector count.
+
+    Both survive restarts, so answers cached on disk are invalidated by a
+    rebuild in an earlier process or by content added to the vector store,
+    while the plain ``load()`` every process start replays keeps them valid.
+    """
+    identity = knowledge_identity(knowledge)
+    with _versions_lock:
+        _read_loaded_at()
+        if identity not in _row_counts:
+            _row_counts[identity] = _row_count(knowledge)
+        return f"{_loaded_at.get(identity, 0)}:{_row_counts[identity]}"
+
+
+def is_cacheable(agent: Any) -> bool:
+    """Whether ``agent``'s answers depend only on its configuration and the prompt"""
+    if any(getattr(agent, attribute, False) for attribute in STATEFUL_ATTRIBUTES):
+        return False
+    memory = getattr(agent, "memory", None)
+    if memory is not None and getattr(memory, "create_user_memories", False):
+        return False
+    return all(is_cacheable(member) for member in getattr(agent, "members", None) or [])
+
+
+def _describe_callable(value: Any) -> str:
+    return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__name__)}"
+
+
+def _describe_text(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_describe_text(item) for item in value]
+    if callable(value):
+        return _describe_callable(value)
+    return str(value)
+
+
+def _describe_tool(tool: Any) -> Any:
+    functions = getattr(tool, "functions", None)
+    if isinstance(functions, dict):
+        return [type(tool).__name__, sorted(functions)]
+    if hasattr(tool, "name") and hasattr(tool, "entrypoint"):
+        return ["Function", tool.name]
+    return _describe_callable(tool)
+
+
+def describe_agent(agent: Any) -> Dict[str, Any]:
+    """The parts of an agent's configuration that determine its answers"""
+    model = getattr(agent, "model", None)
+    knowledge = getattr(agent, "knowledge", None)
+    response_model = getattr(agent, "response_model", None)
+    description = {
+        "class": type(agent).__name__,
+        "model": [type(model).__name__, getattr(model, "id", None)] if model is not None else None,
+        "tools": [_describe_tool(tool) for tool in getattr(agent, "tools", None) or []],
+        "knowledge": [type(knowledge).__name__, knowledge_version(knowledge)] if knowledge is not None else None,
+        "response_model": _describe_callable(response_model) if response_model is not None else None,
+        "members": [describe_agent(member) for member in getattr(agent, "members", None) or []],
+    }
+    for attribute in ("description", "goal", "instructions", "expected_output", "additional_context",
+                      "system_message", "markdown", "add_datetime_to_instructions"):
+        description[attribute] = _describe_text(getattr(agent, attribute, None))
+    return description
+
+
+def agent_fingerprint(agent: Any) -> str:
+    payload = json.dumps(describe_agent(agent), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def normalize_prompt(prompt: str) -> str:
+    return " ".join(prompt.split())
+
+
+class ResponseCache:
+    """SQLite-backed exact-match response cache"""
+
+    def __init__(self, path: str = "tmp/response_cache.db", ttl_seconds: float = 86400,
+                 max_entries: int = 1000, bucket_seconds: float = 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bucket_seconds = bucket_seconds
+        self.hits = 0
+        self.misses = 0
+        self.hit_seconds = 0.0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, agent TEXT, content TEXT, created REAL, last_used REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._db.commit()
+
+    def key(self, agent: Any, prompt: str) -> Optional[str]:
+        """Cache key for running ``prompt`` on ``agent``, or None if it can't be cached"""
+        if not isinstance(prompt, str) or not is_cacheable(agent):
+            return None
+        parts = [agent_fingerprint(agent), normalize_prompt(prompt)]
+        if getattr(agent, "add_datetime_to_instructions", False):
+            parts.append(str(int(time.time() // self.bucket_seconds)))
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        start = time.perf_counter()
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT content, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+            self.hit_seconds += time.perf_counter() - start
+            return row[0]
+
+    def put(self, key: str, agent_name: Optional[str], content: str):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, agent, content, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, agent_name, content, now, now),
+            )
+            if self.max_entries:
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "avg_hit_ms": 1000 * self.hit_seconds / self.hits if self.hits else 0.0,
+            }
@@ -0,0 +1,54 @@
+"""Shared cache in front of ``DuckDuckGoTools`` and ``ExaTools``.
+
+Many agents run the same web searches. Queries are normalized (case and
+whitespace), and toolkit settings that change the results (DuckDuckGo's
+modifier, Exa's search type, category, domain and date filters, ...) are part
+of the key, so two agents only share results when they would have received the
+same ones. Error strings, which ``ExaTools`` returns instead of raising, are
+never cached.
+"""
+
+import re
+from typing import Any, Dict
+
+from utils.tool_cache import ToolCache, cache_toolkit_functions
+
+DUCKDUCKGO_TTLS = {
+    "duckduckgo_search": 3600,
+    "duckduckgo_news": 15 * 60,
+}
+DUCKDUCKGO_KEY_ATTRS = ("modifier", "fixed_max_results")
+
+EXA_TTLS = {
+    "search_exa": 3600,
+    "exa_answer": 3600,
+    "find_similar": 6 * 3600,
+    "get_contents": 24 * 3600,
+}
+EXA_KEY_ATTRS = (
+    "type", "category", "num_results", "start_published_date", "end_published_date", "start_crawl_date",
+    "end_crawl_date", "include_domains", "exclude_domains", "use_autoprompt", "text", "text_length_limit",
+    "highlights", "summary", "livecrawl", "model",
+)
+
+
+def normalize_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    if isinstance(arguments.get("query"), str):
+        arguments["query"] = re.sub(r"\s+", " ", arguments["query"]).strip().lower()
+    if isinstance(arguments.get("url"), str):
+        arguments["url"] = arguments["url"].strip()
+    return arguments
+
+
+def is_result(value: Any) -> bool:
+    """Whether a tool result is data rather than an error message"""
+    return not (isinstance(value, str) and value.startswith("Error"))
+
+
+def cache_toolkit(toolkit: Any, cache: ToolCache):
+    if type(toolkit).__name__ == "ExaTools":
+        namespace, ttls, key_attrs = "exa", EXA_TTLS, EXA_KEY_ATTRS
+    else:
+        namespace, ttls, key_attrs = "duckduckgo", DUCKDUCKGO_TTLS, DUCKDUCKGO_KEY_ATTRS
+    cache_toolkit_functions(toolkit, cache, namespace, ttls, key_attrs,
+                            normalize=normalize_arguments, should_cache=is_result)
@@ -0,0 +1,157 @@
+"""Semantic response cache for FAQ-style agents.
+
+Users phrase the same question in different ways ("What is Agno?", "Explain
+Agno to me"), which the exact-match :mod:`utils.response_cache` can't catch.
+This layer embeds prompts with ``text-embedding-3-small`` and stores them in a
+LanceDB table under ``tmp/lancedb``, next to the agents' own vector stores. A
+prompt whose cosine similarity to a stored one reaches the threshold is
+answered with the stored response.
+
+Only opted-in agents are cached. Opt-in is by registry agent key (the agent's
+directory, e.g. ``agno_assist``); loaders pass each instance they build to
+:meth:`SemanticCache.register`. An explicit opt-in also covers agents with
+chat history, whose answers are then reused across sessions. Rows are scoped
+to the agent's configuration fingerprint, which includes its knowledge base
+version, so reloading the knowledge base invalidates its cached answers.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.response_cache import agent_fingerprint, is_cacheable, normalize_prompt
+
+logger = logging.getLogger("AgnoUnifiedAgent")
+
+
+def _agent_key(name: str) -> str:
+    return "_".join(name.lower().replace("-", " ").split())
+
+
+class SemanticCache:
+    """LanceDB-backed similarity cache of agent responses"""
+
+    def __init__(self, agents: Iterable[str], uri: str = "tmp/lancedb", table_name: str = "semantic_response_cache",
+                 threshold: float = 0.92, ttl_seconds: float = 86400, embedder: Any = None,
+                 max_vectors: int = 256):
+        self.agents = {_agent_key(name) for name in agents}
+        self.uri = uri
+        self.table_name = table_name
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._embedder = embedder
+        self._table = None
+        self._db = None
+        self._lock = threading.Lock()
+        # Registered instances by id(); weak so evicted and reloaded agents are released
+        self._registered: "weakref.WeakValueDictionary[int, Any]" = weakref.WeakValueDictionary()
+        self._keys: Dict[int, str] = {}
+        # Recent prompt embeddings, so a miss's store reuses the vector its lookup computed
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.max_vectors = max_vectors
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, agent_key: str, agent: Any) -> bool:
+        """Enable the cache for ``agent`` if ``agent_key`` opted in"""
+        agent_key = _agent_key(agent_key)
+        if agent_key not in self.agents:
+            return False
+        if not is_cacheable(agent):
+            logger.info(f"Semantic cache enabled for {agent_key} despite its chat history or memory; "
+                        f"similar prompts get the same answer in every session")
+        with self._lock:
+            self._registered[id(agent)] = agent
+            self._keys = {agent_id: key for agent_id, key in self._keys.items() if agent_id in self._registered}
+            self._keys[id(agent)] = agent_key
+        return True
+
+    def _key_for(self, agent: Any) -> Optional[str]:
+        with self._lock:
+            return self._keys.get(id(agent)) if self._registered.get(id(agent)) is agent else None
+
+    def enabled_for(self, agent: Any) -> bool:
+        return self._key_for(agent) is not None
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+            self._embedder = OpenAIEmbedder(id="text-embedding-3-small")
+        return self._embedder
+
+    def _embed(self, prompt: str) -> List[float]:
+        text = normalize_prompt(prompt)
+        with self._lock:
+            vector = self._vectors.get(text)
+            if vector is not None:
+                self._vectors.move_to_end(text)
+                return vector
+        vector = self.embedder.get_embedding(text)
+        if vector:
+            with self._lock:
+                self._vectors[text] = vector
+                while len(self._vectors) > self.max_vectors:
+                    self._vectors.popitem(last=False)
+        return vector
+
+    def _open_table(self):
+        if self._db is None:
+            import lancedb
+            self._db = lancedb.connect(self.uri)
+        if self._table is None and self.table_name in self._db.table_names():
+            self._table = self._db.open_table(self.table_name)
+        return self._table
+
+    def lookup(self, agent: Any, prompt: str) -> Optional[str]:
+        """Return the cached answer to a prompt similar to ``prompt``, if any"""
+        vector = self._embed(prompt)
+        fingerprint = agent_fingerprint(agent)
+        with self._lock:
+            table = self._open_table()
+            matches = []
+            if table is not None and vector:
+                matches = (
+                    table.search(vector)
+                    .metric("cosine")
+                    .where(f"fingerprint = '{fingerprint}' AND created >= {time.time() - self.ttl_seconds}",
+                           prefilter=True)
+                    .limit(1)
+                    .to_list()
+                )
+            if matches and 1.0 - matches[0]["_distance"] >= self.threshold:
+                self.hits += 1
+                logger.info(f"Semantic cache hit for {self._keys.get(id(agent))}: "
+                            f"{prompt!r} ~ {matches[0]['prompt']!r}")
+                return matches[0]["content"]
+            self.misses += 1
+            return None
+
+    def store(self, agent: Any, prompt: str, content: str):
+        vector = self._embed(prompt)
+        if not vector:
+            return
+        row = {
+            "vector": vector,
+            "fingerprint": agent_fingerprint(agent),
+            "agent": self._key_for(agent) or "",
+            "prompt": prompt,
+            "content": content,
+            "created": time.time(),
+        }
+        with self._lock:
+            table = self._open_table()
+            if table is None:
+                self._table = self._db.create_table(self.table_name, data=[row])
+            else:
+                table.add([row])
+                # Drop expired rows and rows from this agent's previous configurations
+                agent_name = row["agent"].replace("'", "''")
+                table.delete(f"created < {time.time() - self.ttl_seconds} OR "
+                             f"(agent = '{agent_name}' AND fingerprint != '{row['fingerprint']}')")
+
+    def stats(self):
+        return {"agents": sorted(self.agents), "hits": self.hits, "misses": self.misses}
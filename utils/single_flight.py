@@ -0,0 +1,123 @@
+"""Coalescing of identical concurrent calls.
+
+When several callers ask for the same thing at once (dashboards polling one
+ticker at market open), only the first call runs; the others attach to it and
+receive its result, or replay its stream from the beginning. The shared work
+runs in its own task, so a caller that goes away doesn't cancel it for the
+others; a call or stream is cancelled once all of its callers have gone.
+
+Flights are tracked per event loop and must be used from that loop's thread.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class _Stream:
+    """Chunks produced so far by one shared stream"""
+
+    def __init__(self):
+        self.chunks: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.result: Any = None
+        self.changed = asyncio.Event()
+        self.task: Optional[asyncio.Future] = None
+        self.subscribers = 0
+
+    def wake(self):
+        # A fresh event per change lets every waiter re-check without clearing races
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
+class _Call:
+    """One shared call and the number of callers still waiting for it"""
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one execution among identical concurrent calls"""
+
+    def __init__(self):
+        self._calls: Dict[Tuple[int, Hashable], _Call] = {}
+        self._streams: Dict[Tuple[int, Hashable], _Stream] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return ``await factory()``, sharing it with concurrent calls for ``key``"""
+        flight_key = (id(asyncio.get_running_loop()), key)
+        call = self._calls.get(flight_key)
+        if call is None:
+            self.started += 1
+            call = self._calls[flight_key] = _Call(asyncio.ensure_future(factory()))
+            call.task.add_done_callback(lambda _: self._calls.pop(flight_key, None))
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                call.task.cancel()
+
+    async def stream(self, key: Hashable, factory: Callable[[Callable[[Any], None]], AsyncIterator[Any]],
+                     on_result: Optional[Callable[[Any], None]] = None) -> AsyncIterator[Any]:
+        """Yield the chunks of ``factory(set_result)``, sharing them with concurrent calls for ``key``.
+
+        ``set_result`` lets the producer record a final value (e.g. the run
+        response with metrics), which every caller receives via ``on_result``.
+        """
+        flight_key = (id(asyncio.get_running_loop()), key)
+        flight = self._streams.get(flight_key)
+        if flight is None:
+            self.started += 1
+            flight = self._streams[flight_key] = _Stream()
+            flight.task = asyncio.ensure_future(self._produce(flight_key, flight, factory))
+        else:
+            self.coalesced += 1
+
+        index = 0
+        flight.subscribers += 1
+        try:
+            while True:
+                while index < len(flight.chunks):
+                    yield flight.chunks[index]
+                    index += 1
+                if flight.done:
+                    break
+                await flight.changed.wait()
+        finally:
+            flight.subscribers -= 1
+            if not flight.subscribers and not flight.done:
+                flight.task.cancel()
+
+        if flight.error is not None:
+            raise flight.error
+        if on_result is not None:
+            on_result(flight.result)
+
+    async def _produce(self, flight_key, flight: _Stream, factory):
+        def set_result(result):
+            flight.result = result
+
+        try:
+            async for chunk in factory(set_result):
+                flight.chunks.append(chunk)
+                flight.wake()
+        except BaseException as e:
+            flight.error = e
+        finally:
+            # Late callers start a new flight rather than replaying a finished one
+            self._streams.pop(flight_key, None)
+            flight.done = True
+            flight.wake()
+
+    def stats(self) -> Dict[str, int]:
+        return {"started": self.started, "coalesced": self.coalesced}
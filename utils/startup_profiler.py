@@ -0,0 +1,187 @@
+"""Startup profiling for the orchestrator.
+
+Measures, per heavy dependency and per agent package, where startup time and
+memory go. Agent packages are profiled in two phases: first the modules the
+agent file imports at top level (import time), then the agent module itself in
+registry load mode (object construction, with demo calls deferred).
+
+Everything runs sequentially in one process, so each row only reports cost
+not already paid by an earlier row; heavy dependencies are profiled first to
+attribute their cost to them rather than to the first agent that uses them.
+"""
+
+import ast
+import importlib
+import json
+import os
+import platform
+import socket
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.import_guard import import_agent
+
+HEAVY_DEPENDENCIES = [
+    "agno.tools.yfinance",
+    "lancedb",
+    "chromadb",
+    "agno.vectordb.pgvector",
+    "google.generativeai",
+    "newspaper",
+    "firecrawl",
+]
+
+SORT_KEYS = {
+    "import": "import_s",
+    "construct": "construct_s",
+    "total": "total_s",
+    "network": "network_calls",
+    "memory": "rss_mb",
+    "name": "name",
+}
+
+
+def rss_bytes() -> int:
+    """Return the current resident set size of this process"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        # Peak rather than current RSS; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class NetworkCounter:
+    """Count outbound socket connections while active"""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+        self._original = None
+
+    def __enter__(self):
+        self._original = socket.socket.connect
+        original = self._original
+        counter = self
+
+        def connect(sock, address):
+            with counter._lock:
+                counter.count += 1
+            return original(sock, address)
+
+        socket.socket.connect = connect
+        return self
+
+    def __exit__(self, *exc):
+        socket.socket.connect = self._original
+
+
+def top_level_imports(path: str) -> List[str]:
+    """Return the absolute module names imported at the top of a module"""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    modules = []
+    for stmt in tree.body:
+        if isinstance(stmt, ast.Import):
+            modules.extend(alias.name for alias in stmt.names)
+        elif isinstance(stmt, ast.ImportFrom) and stmt.module and not stmt.level:
+            modules.append(stmt.module)
+    return list(dict.fromkeys(modules))
+
+
+def _new_row(kind: str, name: str) -> Dict[str, Any]:
+    return {
+        "kind": kind,
+        "name": name,
+        "status": "ok",
+        "import_s": 0.0,
+        "construct_s": 0.0,
+        "total_s": 0.0,
+        "network_calls": 0,
+        "rss_mb": 0.0,
+        "deferred_calls": 0,
+        "error": None,
+    }
+
+
+def _timed_import(modules: List[str]) -> Optional[str]:
+    """Import ``modules`` in order, returning the first error message if any"""
+    error = None
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            error = error or f"{module}: {e}"
+    return error
+
+
+def profile_dependency(module: str) -> Dict[str, Any]:
+    """Profile importing a single dependency"""
+    row = _new_row("dependency", module)
+    rss_before = rss_bytes()
+    with NetworkCounter() as network:
+        start = time.perf_counter()
+        error = _timed_import([module])
+        row["import_s"] = time.perf_counter() - start
+    row["network_calls"] = network.count
+    row["rss_mb"] = (rss_bytes() - rss_before) / (1024 * 1024)
+    if error:
+        row["status"], row["error"] = "missing", error
+    row["total_s"] = row["import_s"]
+    return row
+
+
+def profile_agent(manifest: Dict[str, Any], project_root: str) -> Dict[str, Any]:
+    """Profile an agent package: dependency imports, then object construction"""
+    row = _new_row("agent", manifest["agent_key"])
+    path = os.path.join(project_root, manifest["file"])
+    rss_before = rss_bytes()
+    with NetworkCounter() as network:
+        start = time.perf_counter()
+        _timed_import(top_level_imports(path))
+        row["import_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            _, report = import_agent(manifest["module_path"], manifest["variable"])
+            row["deferred_calls"] = len(report.deferred)
+        except Exception as e:
+            row["status"], row["error"] = "failed", str(e)
+        row["construct_s"] = time.perf_counter() - start
+    row["network_calls"] = network.count
+    row["rss_mb"] = (rss_bytes() - rss_before) / (1024 * 1024)
+    row["total_s"] = row["import_s"] + row["construct_s"]
+    return row
+
+
+def profile_startup(manifests: List[Dict[str, Any]], project_root: str) -> List[Dict[str, Any]]:
+    """Profile heavy dependencies, then every agent package in ``manifests``"""
+    rows = [profile_dependency(module) for module in HEAVY_DEPENDENCIES]
+    rows.extend(profile_agent(manifest, project_root) for manifest in manifests if manifest["variable"])
+    return rows
+
+
+def sort_rows(rows: List[Dict[str, Any]], sort_by: str = "total") -> List[Dict[str, Any]]:
+    key = SORT_KEYS[sort_by]
+    return sorted(rows, key=lambda row: row[key], reverse=key != "name")
+
+
+def write_profile(rows: List[Dict[str, Any]], path: str):
+    """Write the profile as JSON so runs can be compared over time"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rows": rows,
+        }, f, indent=2)
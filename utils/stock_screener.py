@@ -0,0 +1,193 @@
+"""Bulk stock screener.
+
+Sector questions over a handful of tickers fit in one prompt; over hundreds
+they don't. :class:`StockScreenerTools` fetches prices and valuation for the
+whole universe concurrently (through the price store and tool cache), filters
+and ranks it with vectorized NumPy expressions, and hands the model only the
+top rows, so the table it reads is the same size for 500 tickers as for 5.
+
+Filter and rank expressions are a small, safe subset of Python evaluated over
+metric columns, e.g. ``pe < 30 and return_3m > 0`` or ``return_1y / volatility_pct``.
+"""
+
+import ast
+import operator
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from agno.tools import Toolkit
+from agno.utils.log import log_debug
+
+from utils.finance_metrics import collect_metrics, format_value
+from utils.market_snapshot import markdown_table
+
+# Screenable columns and their table headers
+FIELDS = {
+    "last": "Last",
+    "return_1m": "1M %",
+    "return_3m": "3M %",
+    "return_6m": "6M %",
+    "return_1y": "1Y %",
+    "from_high_pct": "From High %",
+    "volatility_pct": "Vol %",
+    "vs_sma_200_pct": "vs SMA200 %",
+    "max_drawdown_pct": "Max DD %",
+    "pe": "P/E",
+    "forward_pe": "Fwd P/E",
+    "eps": "EPS",
+    "dividend_yield": "Div Yield",
+    "market_cap": "Mkt Cap ($B)",
+}
+DEFAULT_COLUMNS = ("last", "return_3m", "return_1y", "volatility_pct", "max_drawdown_pct", "pe", "market_cap")
+
+_COMPARISONS = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt,
+    ast.GtE: operator.ge, ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+_ARITHMETIC = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+_FUNCTIONS = {"abs": np.abs, "log": np.log}
+
+
+def compile_expression(expression: str) -> Callable[[Dict[str, np.ndarray]], np.ndarray]:
+    """Compile a screening expression into a function of the metric columns.
+
+    Supports metric names, numbers, ``+ - * /``, comparisons (chained too),
+    ``and``/``or``/``not``, ``abs()`` and ``log()``. Anything else raises
+    ``ValueError``; nothing is passed to ``eval``.
+    """
+    try:
+        tree = ast.parse(expression, mode="eval").body
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {expression!r}: {e.msg}") from None
+
+    def build(node: ast.AST) -> Callable[[Dict[str, np.ndarray]], np.ndarray]:
+        if isinstance(node, ast.Name):
+            if node.id not in FIELDS:
+                raise ValueError(f"Unknown field {node.id!r}; available: {', '.join(FIELDS)}")
+            return lambda columns: columns[node.id]
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return lambda columns: node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.Not)):
+            operand = build(node.operand)
+            if isinstance(node.op, ast.USub):
+                return lambda columns: -operand(columns)
+            return lambda columns: ~np.asarray(operand(columns), dtype=bool)
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            op, left, right = _ARITHMETIC[type(node.op)], build(node.left), build(node.right)
+            return lambda columns: op(left(columns), right(columns))
+        if isinstance(node, ast.BoolOp):
+            reduce = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            values = [build(value) for value in node.values]
+            return lambda columns: reduce.reduce([np.asarray(value(columns), dtype=bool) for value in values])
+        if isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+            operands = [build(node.left)] + [build(comparator) for comparator in node.comparators]
+            ops = [_COMPARISONS[type(op)] for op in node.ops]
+
+            def compare(columns):
+                values = [operand(columns) for operand in operands]
+                result = ops[0](values[0], values[1])
+                for i, op in enumerate(ops[1:], start=1):
+                    result = result & op(values[i], values[i + 1])
+                return result
+            return compare
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS \
+                and len(node.args) == 1 and not node.keywords:
+            func, argument = _FUNCTIONS[node.func.id], build(node.args[0])
+            return lambda columns: func(argument(columns))
+        raise ValueError(f"Unsupported syntax in {expression!r}: {type(node).__name__}")
+
+    return build(tree)
+
+
+def screen(columns: Dict[str, np.ndarray], filter_expression: Optional[str] = None, rank_by: str = "return_3m",
+           descending: bool = True, top_n: int = 10) -> Tuple[np.ndarray, int, np.ndarray]:
+    """Filter and rank the rows of ``columns``.
+
+    Returns the indices of the ``top_n`` best rows, the number of rows that
+    passed the filter and every row's rank score. Rows without price history
+    or with a NaN score (missing data) never pass.
+    """
+    count = len(columns["has_history"])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mask = columns["has_history"].copy()
+        if filter_expression:
+            mask &= np.broadcast_to(np.asarray(compile_expression(filter_expression)(columns), dtype=bool), count)
+        score = np.broadcast_to(np.asarray(compile_expression(rank_by)(columns), dtype=float), (count,))
+    mask &= np.isfinite(score)
+    candidates = np.flatnonzero(mask)
+    order = np.argsort(-score[candidates] if descending else score[candidates], kind="stable")
+    return candidates[order[:max(top_n, 0)]], len(candidates), score
+
+
+class StockScreenerTools(Toolkit):
+    def __init__(self, max_workers: int = 32, max_symbols: int = 1000, **kwargs):
+        self.max_workers = max_workers
+        self.max_symbols = max_symbols
+        super().__init__(
+            name="stock_screener_tools",
+            tools=[self.screen_stocks],
+            instructions=(
+                "For sector-wide or many-ticker questions, call screen_stocks once with the whole universe "
+                "and a filter/rank expression, then analyze only the top rows it returns."
+            ),
+            add_instructions=True,
+            **kwargs,
+        )
+
+    def screen_stocks(self, symbols: List[str], filter_expression: Optional[str] = None,
+                      rank_by: str = "return_3m", descending: bool = True, top_n: int = 10) -> str:
+        """Use this function to filter and rank a large universe of stocks and return only the top matches.
+
+        Available fields: last, return_1m, return_3m, return_6m, return_1y (percent), from_high_pct,
+        volatility_pct (annualized), vs_sma_200_pct, max_drawdown_pct, pe, forward_pe, eps,
+        dividend_yield, market_cap (dollars).
+
+        Args:
+            symbols (List[str]): The universe to screen, e.g. every ticker in a sector. Hundreds are fine.
+            filter_expression (Optional[str]): Condition rows must meet, e.g.
+                "pe < 30 and return_3m > 0 and market_cap > 10e9". Supports + - * /, comparisons,
+                and/or/not, abs() and log().
+            rank_by (str): Field or expression to sort by, e.g. "return_1y / volatility_pct". Defaults to "return_3m".
+            descending (bool): Sort highest first. Defaults to True.
+            top_n (int): Number of rows to return. Defaults to 10.
+
+        Returns:
+            str: How many symbols were screened and matched, and a Markdown table of the top rows.
+        """
+        symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+        if not symbols:
+            return "Provide at least one symbol."
+        if len(symbols) > self.max_symbols:
+            return f"Too many symbols ({len(symbols)}); the limit is {self.max_symbols}."
+        try:
+            # Reject bad expressions before fetching anything
+            compile_expression(rank_by)
+            if filter_expression:
+                compile_expression(filter_expression)
+        except ValueError as e:
+            return f"Error: {e}"
+        log_debug(f"Screening {len(symbols)} symbols: filter={filter_expression!r} rank_by={rank_by!r}")
+
+        columns = collect_metrics(symbols, include_valuation=True, max_workers=self.max_workers)
+        top, matched, scores = screen(columns, filter_expression, rank_by, descending, top_n)
+        missing = len(symbols) - int(np.sum(columns["has_history"]))
+
+        shown = list(DEFAULT_COLUMNS)
+        if rank_by in FIELDS and rank_by not in shown:
+            shown.insert(1, rank_by)
+        header = ["Rank", "Symbol"] + [FIELDS[name] for name in shown]
+        if rank_by not in FIELDS:
+            header.append("Score")
+        rows = []
+        for rank, i in enumerate(top, start=1):
+            row = [str(rank), symbols[i]]
+            row += [format_value(columns[name][i] / 1e9 if name == "market_cap" else columns[name][i])
+                    for name in shown]
+            if rank_by not in FIELDS:
+                row.append(format_value(scores[i]))
+            rows.append(row)
+
+        summary = (f"Screened {len(symbols)} symbols ({missing} without price data); {matched} matched, "
+                   f"showing top {len(rows)} by {rank_by} ({'highest' if descending else 'lowest'} first).")
+        return summary + "\n\n" + markdown_table(header, rows)
@@ -0,0 +1,227 @@
+"""Process-wide TTL cache for tool calls.
+
+Several agents call the same data tools (YFinance, web search, scraping) with
+the same arguments. :class:`ToolCache` sits in front of those calls:
+
+- results are kept in memory and, optionally, in SQLite so they survive
+  restarts and are shared with other processes;
+- every function has its own TTL;
+- concurrent identical calls are deduplicated, so only the first one reaches
+  the provider and the others wait for its result.
+
+Toolkits bind their methods into ``Function`` objects when constructed, so
+caching is applied per toolkit instance: :func:`install_agent_caches` walks an
+agent's tools (and team members) and wraps the entrypoints of every toolkit
+type with a registered adapter module.
+"""
+
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger("AgnoUnifiedAgent")
+
+# Toolkit class -> module providing ``cache_toolkit(toolkit, cache)``
+ADAPTERS = {
+    "agno.tools.yfinance.YFinanceTools": "utils.yfinance_cache",
+    "agno.tools.duckduckgo.DuckDuckGoTools": "utils.search_cache",
+    "agno.tools.exa.ExaTools": "utils.search_cache",
+    "agno.tools.firecrawl.FirecrawlTools": "utils.firecrawl_cache",
+}
+
+_MISSING = object()
+
+
+class ToolCache:
+    """Memory (and optionally SQLite) cache with per-call TTLs and in-flight dedupe"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS tool_cache (key TEXT PRIMARY KEY, value TEXT, expires REAL)")
+            self._db.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+
+    def _lookup(self, key: str) -> Any:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        if self._db is not None:
+            row = self._db.execute("SELECT value, expires FROM tool_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[1] > now:
+                value = json.loads(row[0])
+                self._memory[key] = (row[1], value)
+                return value
+        return _MISSING
+
+    def _store(self, key: str, value: Any, ttl: float):
+        expires = time.time() + ttl
+        self._memory[key] = (expires, value)
+        if self._db is not None:
+            try:
+                payload = json.dumps(value)
+            except (TypeError, ValueError):
+                return
+            self._db.execute("INSERT OR REPLACE INTO tool_cache (key, value, expires) VALUES (?, ?, ?)",
+                             (key, payload, expires))
+            self._db.commit()
+
+    def get_or_call(self, key: str, ttl: float, call: Callable[[], Any],
+                    should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Return the cached value for ``key`` or compute it with ``call``"""
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                self.misses += 1
+                future = self._in_flight[key] = Future()
+            else:
+                self.deduplicated += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = call()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            if should_cache is None or should_cache(value):
+                self._store(key, value, ttl)
+            self._in_flight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM tool_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._memory), "hits": self.hits, "misses": self.misses,
+                    "deduplicated": self.deduplicated}
+
+
+def call_key(namespace: str, func: Callable, args: tuple, kwargs: dict, extra: Iterable[Any] = (),
+             normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None) -> str:
+    """Stable key for a call, with defaults applied so equivalent calls match"""
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+    except TypeError:
+        arguments = {"args": list(args), **kwargs}
+    if normalize is not None:
+        arguments = normalize(arguments)
+    payload = json.dumps([namespace, getattr(func, "__name__", str(func)), list(extra), arguments],
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_function(cache: ToolCache, func: Callable, namespace: str, ttl: float, extra: Iterable[Any] = (),
+                   normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                   should_cache: Optional[Callable[[Any], bool]] = None) -> Callable:
+    """Wrap ``func`` so its results are served from ``cache`` for ``ttl`` seconds"""
+    extra = list(extra)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = call_key(namespace, func, args, kwargs, extra, normalize)
+        return cache.get_or_call(key, ttl, lambda: func(*args, **kwargs), should_cache)
+
+    wrapper.__tool_cache_original__ = func
+    return wrapper
+
+
+def cache_toolkit_functions(toolkit: Any, cache: ToolCache, namespace: str, ttls: Dict[str, float],
+                            key_attrs: Iterable[str] = (), **options):
+    """Wrap the registered functions of ``toolkit`` listed in ``ttls``.
+
+    ``key_attrs`` names toolkit attributes that change results (search type,
+    date filters, ...) and therefore become part of the key.
+    """
+    extra = [getattr(toolkit, attribute, None) for attribute in key_attrs]
+    for name, function in getattr(toolkit, "functions", {}).items():
+        entrypoint = getattr(function, "entrypoint", None)
+        if name not in ttls or entrypoint is None or hasattr(entrypoint, "__tool_cache_original__"):
+            continue
+        function.entrypoint = cache_function(cache, entrypoint, namespace, ttls[name], extra, **options)
+
+
+def _toolkits(agent: Any):
+    for tool in getattr(agent, "tools", None) or []:
+        yield tool
+    for member in getattr(agent, "members", None) or []:
+        yield from _toolkits(member)
+    team = getattr(agent, "team", None)
+    if isinstance(team, list):
+        for member in team:
+            yield from _toolkits(member)
+
+
+def install_agent_caches(agent: Any, cache: Optional[ToolCache] = None) -> int:
+    """Put the shared cache in front of every supported toolkit of ``agent``.
+
+    Returns the number of toolkits wrapped. Adapter modules are only imported
+    for toolkit types the agent actually uses.
+    """
+    cache = cache or get_tool_cache()
+    if cache is None:
+        return 0
+    wrapped = 0
+    for tool in _toolkits(agent):
+        adapter = ADAPTERS.get(f"{type(tool).__module__}.{type(tool).__qualname__}")
+        if adapter is None:
+            continue
+        try:
+            importlib.import_module(adapter).cache_toolkit(tool, cache)
+            wrapped += 1
+        except Exception as e:
+            logger.warning(f"Could not cache {type(tool).__name__} calls: {e}")
+    return wrapped
+
+
+_cache: Optional[ToolCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> Optional[ToolCache]:
+    """Return the process-wide tool cache, or None when disabled"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from config.settings import Settings
+            settings = Settings()
+            if not settings.tool_cache:
+                return None
+            _cache = ToolCache(settings.tool_cache_path or None)
+        return _cache
@@ -0,0 +1,52 @@
+"""Shared cache in front of ``YFinanceTools``.
+
+Prices change by the second while company profiles and analyst
+recommendations change a few times a day at most, so every YFinance function
+gets its own TTL. Symbols are normalized (``" nvda"`` and ``"NVDA"`` share
+an entry), and error messages, which the toolkit returns as strings instead of
+raising, are never cached. Daily price history is served from the local
+:mod:`price store <utils.price_store>`.
+"""
+
+from typing import Any, Dict
+
+from utils.tool_cache import ToolCache, cache_toolkit_functions
+
+NAMESPACE = "yfinance"
+
+# Seconds each function's result stays fresh
+TTLS = {
+    "get_current_stock_price": 30,
+    "get_historical_stock_prices": 15 * 60,
+    "get_technical_indicators": 15 * 60,
+    "get_company_news": 15 * 60,
+    "get_stock_fundamentals": 6 * 3600,
+    "get_key_financial_ratios": 6 * 3600,
+    "get_analyst_recommendations": 6 * 3600,
+    "get_company_info": 12 * 3600,
+    "get_income_statements": 24 * 3600,
+}
+
+
+def normalize_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    if isinstance(arguments.get("symbol"), str):
+        arguments["symbol"] = arguments["symbol"].strip().upper()
+    return arguments
+
+
+def is_result(value: Any) -> bool:
+    """Whether a tool result is data rather than an error message"""
+    return not (isinstance(value, str) and value.startswith(("Error", "Could not")))
+
+
+def cache_toolkit(toolkit: Any, cache: ToolCache):
+    history = getattr(toolkit, "functions", {}).get("get_historical_stock_prices")
+    if history is not None and not hasattr(history.entrypoint, "__tool_cache_original__") \
+            and not getattr(history.entrypoint, "__price_store__", False):
+        from utils.price_store import get_price_store, serve_history
+
+        store = get_price_store()
+        if store is not None:
+            # Daily history comes from the local store; the TTL cache still sits in front
+            history.entrypoint = serve_history(store, history.entrypoint)
+    cache_toolkit_functions(toolkit, cache, NAMESPACE, TTLS, normalize=normalize_arguments, should_cache=is_result)